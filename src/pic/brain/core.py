@@ -241,6 +241,22 @@ class BrainCore:
         # TODO: Add baseline retraining logic
         # This would check if baselines need updating based on drift
     
+    def reset(self) -> None:
+        """Reset learned in-memory state so the instance can be reused.
+        
+        Clears profiler samples, trace history, cached patterns and
+        processing counters. Persistent stores are left untouched.
+        """
+        self.profiler.clear()
+        self.trace_store.clear()
+        if self.pattern_cache:
+            self.pattern_cache.clear()
+        
+        self._events_processed = 0
+        self._security_violations = 0
+        self._soft_allows = 0
+        self._cache_hits = 0
+    
     def get_stats(self) -> dict:
         """Get processing statistics.
         
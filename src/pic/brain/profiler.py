@@ -1,6 +1,7 @@
 """Baseline profiler for statistical behavior analysis."""
 
-import statistics
+import math
+from array import array
 from datetime import datetime, timedelta
 from typing import List, Optional
 from pic.models.baseline import BaselineProfile
@@ -17,7 +18,7 @@ class BaselineProfiler:
             min_samples: Minimum samples required for baseline
         """
         self.min_samples = min_samples
-        self._samples: dict = {}  # function_name -> list of durations
+        self._samples: dict = {}  # function_name -> array('d') of durations
     
     def add_sample(self, event: TelemetryEvent) -> None:
         """Add telemetry sample to profile.
@@ -27,9 +28,13 @@ class BaselineProfiler:
         """
         key = f"{event.module_name}.{event.function_name}"
         if key not in self._samples:
-            self._samples[key] = []
+            self._samples[key] = array('d')
         self._samples[key].append(event.duration_ms)
     
+    def clear(self) -> None:
+        """Discard all collected samples."""
+        self._samples.clear()
+    
     def compute_baseline(self, function_name: str, module_name: str) -> Optional[BaselineProfile]:
         """Compute baseline profile for a function.
         
@@ -41,14 +46,20 @@ class BaselineProfiler:
             BaselineProfile if sufficient samples, None otherwise
         """
         key = f"{module_name}.{function_name}"
-        samples = self._samples.get(key, [])
+        samples = self._samples.get(key, ())
         
-        if len(samples) < self.min_samples:
+        n = len(samples)
+        if n < self.min_samples:
             return None
         
-        # Compute statistics
-        mean = statistics.mean(samples)
-        std = statistics.stdev(samples) if len(samples) > 1 else 0.0
+        # Compute statistics. Two fsum passes over the float buffer are
+        # accurate to rounding and far cheaper than the statistics module's
+        # exact fraction arithmetic, which matters because training
+        # recomputes the baseline on every sample past min_samples
+        mean = math.fsum(samples) / n
+        std = 0.0
+        if n > 1:
+            std = math.sqrt(math.fsum([(x - mean) ** 2 for x in samples]) / (n - 1))
         sorted_samples = sorted(samples)
         
         return BaselineProfile(
@@ -57,7 +68,7 @@ class BaselineProfiler:
             version=1,
             created_at=datetime.now(),
             updated_at=datetime.now(),
-            sample_count=len(samples),
+            sample_count=n,
             mean_duration_ms=mean,
             std_duration_ms=std,
             p50_duration_ms=sorted_samples[len(sorted_samples) // 2],
@@ -1,5 +1,6 @@
 """CellAgent instrumentation module."""
 
 from pic.cellagent.agent import CellAgent
+from pic.cellagent.clock import FakeClock, clock_override
 
-__all__ = ["CellAgent"]
+__all__ = ["CellAgent", "FakeClock", "clock_override"]
@@ -5,16 +5,19 @@ import os
 import logging
 import threading
 import uuid
+from array import array
 from functools import wraps
+from dataclasses import replace
 from collections import deque
 from datetime import datetime
-from typing import Callable, Any, Optional
+from typing import Callable, Any, Iterable, List, Optional, Sequence
 
 from pic.config import PICConfig
 from pic.models.events import TelemetryEvent
 from pic.models.decision import Decision
 from pic.cellagent.redaction import PIIRedactor
 from pic.cellagent.rate_limiter import RateLimiter
+from pic.cellagent import clock
 
 
 class CellAgent:
@@ -89,10 +92,12 @@ class CellAgent:
             def process_payment(amount, user_id):
                 return {"status": "success"}
         """
+        func_name = func.__name__
+        
         @wraps(func)
         def wrapper(*args, **kwargs):
             # Check rate limit first
-            if not self.rate_limiter.check_rate(func.__name__):
+            if not self.rate_limiter.check_rate(func_name):
                 self._throttle_events += 1
                 # Execute without instrumentation if throttled
                 return func(*args, **kwargs)
@@ -105,7 +110,7 @@ class CellAgent:
                 return func(*args, **kwargs)
             
             # Capture start time
-            start_time = time.perf_counter()
+            start_time = clock.perf_counter()
             exception_occurred = None
             result = None
             decision = None
@@ -155,7 +160,7 @@ class CellAgent:
             finally:
                 # Always capture telemetry (even on exception)
                 try:
-                    end_time = time.perf_counter()
+                    end_time = clock.perf_counter()
                     duration_ms = (end_time - start_time) * 1000
                     
                     # Create telemetry event
@@ -174,8 +179,145 @@ class CellAgent:
                     # Never let instrumentation crash the app
                     print(f"CellAgent error (non-fatal): {e}")
         
+        # Fully qualified key, computed once rather than per lookup
+        wrapper._pic_key = f"{func.__module__}.{func_name}"
+        
+        return wrapper
+    
+    def monitor_fast(self, func: Callable, capacity: int = 1024) -> Callable:
+        """Instrument a trusted baseline function with timing only.
+        
+        The wrapper skips rate limiting, sampling, redaction and Brain
+        decisions, and just writes each call's duration into a preallocated
+        ring. commit_fast() turns the recorded durations into buffered
+        telemetry in one step. Meant for single-threaded baseline loops over
+        known-benign inputs; attack invocations should go through monitor().
+        
+        Args:
+            func: Function (or its monitor wrapper) to time
+            capacity: Number of most recent durations kept until committed
+            
+        Returns:
+            Wrapped function
+        """
+        func = getattr(func, "__wrapped__", func)
+        durations = array("d", bytes(8 * capacity))
+        state = [0, None]  # Calls recorded, representative (args, kwargs)
+        
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            start_time = clock.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                durations[state[0] % capacity] = (clock.perf_counter() - start_time) * 1000
+                if state[1] is None:
+                    state[1] = (args, kwargs)
+                state[0] += 1
+        
+        wrapper._pic_key = f"{func.__module__}.{func.__name__}"
+        wrapper._pic_durations = durations
+        wrapper._pic_state = state
+        
         return wrapper
     
+    def commit_fast(self, wrapper: Callable) -> int:
+        """Buffer the durations recorded by a monitor_fast() wrapper.
+        
+        The first recorded call's arguments stand in for every observation,
+        as with seed_baseline(). The wrapper's ring is reset afterwards.
+        
+        Args:
+            wrapper: Function returned by monitor_fast()
+            
+        Returns:
+            Number of observations buffered
+        """
+        durations = wrapper._pic_durations
+        state = wrapper._pic_state
+        count, sample = state
+        if not count:
+            return 0
+        
+        capacity = len(durations)
+        if count <= capacity:
+            recorded = durations[:count]
+        else:
+            # Oldest first; the ring has wrapped around
+            split = count % capacity
+            recorded = durations[split:] + durations[:split]
+        
+        args, kwargs = sample
+        self.seed_baseline(wrapper, recorded, *args, **kwargs)
+        
+        state[0] = 0
+        state[1] = None
+        return len(recorded)
+    
+    def monitor_batch(self, func: Callable, inputs: Iterable[Any]) -> List[Any]:
+        """Call a monitored function once per input, buffering telemetry in bulk.
+        
+        Equivalent to [func(x) for x in inputs], but the calls' events are
+        added to the buffer together instead of taking the buffer lock once
+        per call. Rate limiting and sampling still apply to every call. With
+        a Brain connected each call needs its own decision, so the calls go
+        through the monitor wrapper one at a time (func is wrapped first if
+        it isn't already monitored).
+        
+        Args:
+            func: Function decorated with monitor (or the undecorated function)
+            inputs: Single positional argument for each call
+            
+        Returns:
+            Result of each call, in input order
+        """
+        if self._brain_connector:
+            # Every call needs the monitor wrapper for its Brain decision
+            if not hasattr(func, "_pic_key"):
+                func = self.monitor(func)
+            return [func(item) for item in inputs]
+        
+        func = getattr(func, "__wrapped__", func)
+        func_name = func.__name__
+        results = []
+        events = []
+        
+        try:
+            for item in inputs:
+                if not self.rate_limiter.check_rate(func_name):
+                    self._throttle_events += 1
+                    results.append(func(item))
+                    continue
+                
+                if not self._should_sample():
+                    results.append(func(item))
+                    continue
+                
+                start_time = clock.perf_counter()
+                exception_occurred = None
+                try:
+                    results.append(func(item))
+                except Exception as e:
+                    exception_occurred = e
+                    raise
+                finally:
+                    duration_ms = (clock.perf_counter() - start_time) * 1000
+                    events.append(self._create_telemetry_event(
+                        func=func,
+                        args=(item,),
+                        kwargs={},
+                        duration_ms=duration_ms,
+                        exception=exception_occurred
+                    ))
+        finally:
+            # Buffer whatever ran, even if a call raised
+            if events:
+                with self._lock:
+                    self._buffer.extend(events)
+                    self._total_events += len(events)
+        
+        return results
+    
     def _should_sample(self) -> bool:
         """Determine if this event should be sampled.
         
@@ -238,6 +380,41 @@ class CellAgent:
         
         return event
     
+    def seed_baseline(
+        self,
+        func: Callable,
+        durations_ms: Sequence[float],
+        *args: Any,
+        **kwargs: Any
+    ) -> None:
+        """Buffer synthetic observations of a function without calling it.
+        
+        Lets tests establish a baseline from known durations instead of
+        making real calls. Events are buffered like sampled calls but are
+        not sent to a connected Brain for a decision.
+        
+        Args:
+            func: Function (or its monitor wrapper) to record observations for
+            durations_ms: Execution duration of each observation
+            *args: Representative positional arguments
+            **kwargs: Representative keyword arguments
+        """
+        if not durations_ms:
+            return
+        
+        func = getattr(func, "__wrapped__", func)
+        
+        # Redact the representative arguments once and stamp out copies
+        template = self._create_telemetry_event(func, args, kwargs, duration_ms=0.0)
+        events = [
+            replace(template, event_id=str(uuid.uuid4()), duration_ms=duration_ms)
+            for duration_ms in durations_ms
+        ]
+        
+        with self._lock:
+            self._buffer.extend(events)
+            self._total_events += len(events)
+    
     def _add_to_buffer(self, event: TelemetryEvent) -> None:
         """Add event to buffer.
         
@@ -301,6 +478,17 @@ class CellAgent:
                         except Exception as e:
                             print(f"Error sending batch: {e}")
     
+    def reset(self) -> None:
+        """Discard buffered telemetry and counters so the agent can be reused."""
+        with self._lock:
+            self._buffer.clear()
+            self._sample_counter = 0
+            self._total_events = 0
+        
+        self._latencies.clear()
+        self._throttle_events = 0
+        self.rate_limiter.reset()
+    
     def set_send_callback(self, callback: Callable) -> None:
         """Set callback for sending telemetry batches.
         
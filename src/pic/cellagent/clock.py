@@ -0,0 +1,104 @@
+"""Overridable clock used by CellAgent to time monitored calls.
+
+Tests that only need PIC to observe a latency can run monitored code under
+clock_override() and call sleep() instead of time.sleep(): the simulated
+clock advances instantly and the monitor records the simulated duration.
+Overrides are thread-local, so concurrent tests don't share a clock.
+"""
+
+import time
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class FakeClock:
+    """Manually advanced clock."""
+    
+    def __init__(self, start: float = 0.0):
+        """Initialize FakeClock.
+        
+        Args:
+            start: Initial time in seconds
+        """
+        self.now = start
+    
+    def advance(self, seconds: float) -> None:
+        """Move the clock forward.
+        
+        Args:
+            seconds: Time to advance in seconds
+        """
+        self.now += seconds
+    
+    def advance_ms(self, milliseconds: float) -> None:
+        """Move the clock forward.
+        
+        Args:
+            milliseconds: Time to advance in milliseconds
+        """
+        self.now += milliseconds / 1000.0
+
+
+_local = threading.local()
+
+
+def current_clock() -> Optional[FakeClock]:
+    """Get the clock overriding real time in this thread, if any."""
+    return getattr(_local, "clock", None)
+
+
+@contextmanager
+def clock_override(start: float = 0.0) -> Iterator[FakeClock]:
+    """Replace real time with a FakeClock in the current thread.
+    
+    Args:
+        start: Initial time in seconds
+    
+    Yields:
+        The FakeClock in effect
+    """
+    previous = current_clock()
+    clock = FakeClock(start)
+    _local.clock = clock
+    try:
+        yield clock
+    finally:
+        _local.clock = previous
+
+
+def run_simulated(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Call func under a clock override in the current thread.
+    
+    For tests where PIC only needs to observe each operation's duration:
+    sleep() calls inside func advance the simulated clock without blocking.
+    
+    Args:
+        func: Function to run
+        *args: Positional arguments for func
+        **kwargs: Keyword arguments for func
+        
+    Returns:
+        func's return value
+    """
+    with clock_override():
+        return func(*args, **kwargs)
+
+
+def perf_counter() -> float:
+    """time.perf_counter(), or the overriding clock's time."""
+    clock = getattr(_local, "clock", None)
+    if clock is None:
+        return time.perf_counter()
+    return clock.now
+
+
+def sleep(seconds: float) -> None:
+    """time.sleep(), or advance the overriding clock without blocking."""
+    clock = getattr(_local, "clock", None)
+    if clock is None:
+        time.sleep(seconds)
+    else:
+        clock.now += seconds
@@ -140,6 +140,13 @@ class RateLimiter:
         self._dropped_events = 0
         self._window_start = time.time()
     
+    def reset(self) -> None:
+        """Reset the rate window and accumulated statistics."""
+        self._reset_window()
+        self._total_checks = 0
+        self._total_allowed = 0
+        self._total_throttled = 0
+    
     def get_stats(self) -> dict:
         """Get rate limiter statistics.
         
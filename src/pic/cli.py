@@ -50,7 +50,11 @@ def start_service(config_path=None):
     # Initialize components
     crypto = CryptoCore("/var/lib/pic/signing.key")
     state_store = StateStore(config.get("storage.state_db_path"))
-    audit_store = AuditStore(config.get("storage.audit_log_path"), crypto)
+    audit_store = AuditStore(
+        config.get("storage.audit_log_path"),
+        crypto,
+        fsync_interval=config.get("storage.audit_fsync_interval", 1)
+    )
     trace_store = TraceStore(config.get("storage.trace_buffer_size"))
     
     # Create brain
@@ -64,7 +68,11 @@ def start_service(config_path=None):
     )
     
     print(f"SentinelBrain listening on {config.get('api.listen_address')}:{config.get('api.listen_port')}")
-    api.start()
+    try:
+        api.start()
+    finally:
+        # Persist audit events still buffered when the service exits
+        audit_store.close()
 
 
 def show_status():
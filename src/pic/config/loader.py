@@ -40,6 +40,7 @@ class PICConfig:
         "storage": {
             "state_db_path": "/var/lib/pic/state.db",
             "audit_log_path": "/var/lib/pic/audit.log",
+            "audit_fsync_interval": 1,
             "trace_buffer_size": 1000,
         },
         "api": {
@@ -4,7 +4,7 @@ import hmac
 import hashlib
 import secrets
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Optional, Tuple
 
 
 class CryptoCore:
@@ -15,6 +15,11 @@ class CryptoCore:
     - SHA-256 hashing for PII and signatures
     - Key generation and management
     - Signature verification
+    
+    All SHA-256 work goes through hashlib, whose OpenSSL backend uses the
+    CPU's SHA extensions (SHA-NI / ARMv8 SHA2) where available; callers
+    should pass complete byte strings so each message is hashed in a
+    single update.
     """
     
     def __init__(self, key_path: str):
@@ -25,16 +30,29 @@ class CryptoCore:
         """
         self.key_path = Path(key_path)
         self._signing_key: Optional[bytes] = None
+        self._hmac_base: Optional[hmac.HMAC] = None
         self._load_or_generate_key()
     
+    def _set_signing_key(self, key: bytes) -> None:
+        """Install a signing key and its keyed HMAC template.
+        
+        HMAC pads and hashes the key before any data; doing that once here
+        lets each signature start from a copy of the keyed state.
+        
+        Args:
+            key: Raw signing key
+        """
+        self._signing_key = key
+        self._hmac_base = hmac.new(key, digestmod=hashlib.sha256)
+    
     def _load_or_generate_key(self) -> None:
         """Load existing key or generate new one."""
         if self.key_path.exists():
             with open(self.key_path, "rb") as f:
-                self._signing_key = f.read()
+                self._set_signing_key(f.read())
         else:
             # Generate new 256-bit key
-            self._signing_key = secrets.token_bytes(32)
+            self._set_signing_key(secrets.token_bytes(32))
             
             # Ensure directory exists
             self.key_path.parent.mkdir(parents=True, exist_ok=True)
@@ -61,16 +79,13 @@ class CryptoCore:
             >>> signature
             'a1b2c3d4...'
         """
-        if self._signing_key is None:
+        if self._hmac_base is None:
             raise RuntimeError("Signing key not initialized")
         
-        signature = hmac.new(
-            self._signing_key,
-            data,
-            hashlib.sha256
-        ).hexdigest()
+        mac = self._hmac_base.copy()
+        mac.update(data)
         
-        return signature
+        return mac.hexdigest()
     
     def verify_signature(self, data: bytes, signature: str) -> bool:
         """Verify HMAC-SHA256 signature.
@@ -89,14 +104,44 @@ class CryptoCore:
             >>> crypto.verify_signature(data, sig)
             True
         """
-        if self._signing_key is None:
+        if self._hmac_base is None:
             raise RuntimeError("Signing key not initialized")
         
-        expected_signature = self.hmac_sign(data)
+        mac = self._hmac_base.copy()
+        mac.update(data)
+        expected_signature = mac.hexdigest()
         
         # Use constant-time comparison to prevent timing attacks
         return hmac.compare_digest(signature, expected_signature)
     
+    def verify_batch(self, pairs: Iterable[Tuple[bytes, str]]) -> bool:
+        """Verify a sequence of HMAC-SHA256 signatures.
+        
+        Same check as verify_signature() for each pair, with the keyed
+        template and comparison looked up once for the whole batch. Stops
+        consuming pairs at the first invalid signature.
+        
+        Args:
+            pairs: (data, hex-encoded signature) pairs
+            
+        Returns:
+            True if every signature is valid, False otherwise
+        """
+        if self._hmac_base is None:
+            raise RuntimeError("Signing key not initialized")
+        
+        copy_base = self._hmac_base.copy
+        compare_digest = hmac.compare_digest
+        
+        for data, signature in pairs:
+            mac = copy_base()
+            mac.update(data)
+            # Use constant-time comparison to prevent timing attacks
+            if not compare_digest(signature, mac.hexdigest()):
+                return False
+        
+        return True
+    
     @staticmethod
     def sha256_hash(data: bytes) -> str:
         """Generate SHA-256 hash of data.
@@ -157,7 +202,7 @@ class CryptoCore:
         new_key_path_obj.rename(self.key_path)
         
         # Update in-memory key
-        self._signing_key = new_key
+        self._set_signing_key(new_key)
     
     def get_key_fingerprint(self) -> str:
         """Get fingerprint of current signing key.
@@ -123,6 +123,7 @@ class IntegratedPIC:
         
         self.logger.info("Stopping IntegratedPIC...")
         self.agent.stop()
+        self.audit_store.close()
         self._running = False
         self.logger.info("✓ IntegratedPIC stopped")
     
@@ -3,7 +3,10 @@
 import json
 from dataclasses import dataclass, asdict
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Union
+
+# Reused for signable data; json.dumps builds a new encoder whenever options are passed
+_SORTED_ENCODER = json.JSONEncoder(sort_keys=True)
 
 
 @dataclass
@@ -82,15 +85,27 @@ class AuditEvent:
     anomaly_score: Optional[float] = None
     metadata: Optional[Dict[str, Any]] = None
     
+    def _fields(self) -> Dict[str, Any]:
+        """Shallow field dict with the timestamp as an ISO string.
+        
+        Cheaper than asdict(), which deep-copies metadata; only used for
+        serialization, where the copy never escapes.
+        """
+        data = dict(self.__dict__)
+        data["timestamp"] = self.timestamp.isoformat()
+        return data
+    
     def to_json(self) -> str:
         """Serialize to JSON string."""
-        data = asdict(self)
-        data["timestamp"] = self.timestamp.isoformat()
-        return json.dumps(data)
+        return json.dumps(self._fields())
+    
+    def to_json_bytes(self) -> bytes:
+        """Serialize to UTF-8 encoded JSON, ready to write to a binary file."""
+        return json.dumps(self._fields()).encode("utf-8")
     
     @classmethod
-    def from_json(cls, json_str: str) -> "AuditEvent":
-        """Deserialize from JSON string."""
+    def from_json(cls, json_str: Union[str, bytes]) -> "AuditEvent":
+        """Deserialize from JSON string or UTF-8 bytes."""
         data = json.loads(json_str)
         data["timestamp"] = datetime.fromisoformat(data["timestamp"])
         return cls(**data)
@@ -104,10 +119,13 @@ class AuditEvent:
     def get_signable_data(self) -> bytes:
         """Get data to be signed (excludes signature field).
         
+        AuditStore writes these bytes to the log with the signature spliced
+        in as the last field, so this is also the on-disk entry layout.
+        
         Returns:
             Bytes representation of event data for signing
         """
-        data = self.to_dict()
+        data = self._fields()
         # Remove signature field before signing
         data.pop("signature", None)
-        return json.dumps(data, sort_keys=True).encode("utf-8")
+        return _SORTED_ENCODER.encode(data).encode("utf-8")
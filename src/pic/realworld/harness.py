@@ -3,9 +3,14 @@
 Central orchestration component for executing real-world test scenarios.
 """
 
+import os
 import time
+import threading
+from array import array
+from collections import Counter
+from contextlib import contextmanager
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional, Sequence
 from dataclasses import dataclass, field
 from enum import Enum
 import logging
@@ -14,6 +19,8 @@ from pic.realworld.safety import SafetyController
 from pic.realworld.sandbox import SandboxManager
 from pic.cellagent import CellAgent
 from pic.brain.core import BrainCore
+from pic.brain.detector import AnomalyDetector
+from pic.effector.executor import Effector
 from pic.storage.state_store import StateStore
 from pic.storage.audit_store import AuditStore
 from pic.storage.trace_store import TraceStore
@@ -40,7 +47,8 @@ class TestResult:
     detections: int = 0
     false_positives: int = 0
     false_negatives: int = 0
-    anomaly_scores: List[float] = field(default_factory=list)
+    # Compact float buffer; grows by amortised appends/extends
+    anomaly_scores: array = field(default_factory=lambda: array('d'))
     error_message: Optional[str] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
     
@@ -53,6 +61,142 @@ class TestResult:
             self.error_message = error
 
 
+@dataclass
+class PICHandles:
+    """Components of a PIC instance, resolved once at setup.
+    
+    Optional components are None when the brain doesn't provide them.
+    """
+    agent: CellAgent
+    brain: BrainCore
+    effector: Optional[Effector] = None
+    state_store: Optional[StateStore] = None
+    detector: Optional[AnomalyDetector] = None
+    
+    @classmethod
+    def resolve(cls, agent: CellAgent, brain: BrainCore) -> "PICHandles":
+        """Resolve component handles from an agent/brain pair."""
+        return cls(
+            agent=agent,
+            brain=brain,
+            effector=getattr(brain, "effector", None),
+            state_store=getattr(brain, "state_store", None),
+            detector=getattr(brain, "detector", None)
+        )
+
+
+_MISSING = object()
+
+# precise_sleep() sleeps until this close to the deadline, then spins it out
+_SPIN_NS = 1_000_000
+
+
+@contextmanager
+def patched_attributes(target: Any, **overrides: Any) -> Iterator[Any]:
+    """Temporarily override attributes on a PIC component.
+    
+    Used by failure-mode scenarios so that simulated faults don't leak into
+    a PIC instance that is reused by later scenarios.
+    
+    Args:
+        target: Object to patch
+        **overrides: Attribute names and their temporary values
+        
+    Yields:
+        The patched target
+    """
+    saved = {name: vars(target).get(name, _MISSING) for name in overrides}
+    try:
+        for name, value in overrides.items():
+            setattr(target, name, value)
+        yield target
+    finally:
+        for name, original in saved.items():
+            if original is _MISSING:
+                # Attribute came from the class (or didn't exist); drop the override
+                if name in vars(target):
+                    delattr(target, name)
+            else:
+                setattr(target, name, original)
+
+
+@contextmanager
+def pinned_to_cpu(cpu: int = 0, realtime: bool = False) -> Iterator[None]:
+    """Pin the calling thread to one CPU while timing-sensitive code runs.
+    
+    Keeps the scheduler from migrating baseline measurements between cores.
+    Threads started inside the block inherit the affinity. With realtime,
+    SCHED_FIFO is also requested (needs CAP_SYS_NICE; skipped otherwise).
+    On platforms without sched_setaffinity (macOS, Windows) this is a no-op.
+    
+    Args:
+        cpu: CPU to pin to
+        realtime: Whether to request SCHED_FIFO priority
+    """
+    if not hasattr(os, "sched_setaffinity"):
+        yield
+        return
+    
+    saved_affinity = os.sched_getaffinity(0)
+    saved_policy = None
+    try:
+        try:
+            os.sched_setaffinity(0, {cpu})
+        except OSError:
+            pass  # CPU not available to this process
+        
+        if realtime:
+            try:
+                policy, param = os.sched_getscheduler(0), os.sched_getparam(0)
+                os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(1))
+                saved_policy = (policy, param)
+            except OSError:
+                pass  # Not permitted
+        
+        yield
+    finally:
+        if saved_policy is not None:
+            os.sched_setscheduler(0, *saved_policy)
+        os.sched_setaffinity(0, saved_affinity)
+
+
+def precise_sleep(seconds: float) -> None:
+    """Block for a duration without kernel wake-up jitter.
+    
+    Short durations are busy-waited; longer ones sleep until ~1ms before
+    the deadline and spin for the rest, so injected latencies and
+    millisecond baselines don't pick up scheduler noise.
+    
+    Args:
+        seconds: Duration in seconds
+    """
+    now = time.monotonic_ns
+    delay_ns = int(seconds * 1_000_000_000)
+    deadline = now() + delay_ns
+    if delay_ns > 2 * _SPIN_NS:
+        time.sleep((delay_ns - _SPIN_NS) / 1_000_000_000)
+    while now() < deadline:
+        pass
+
+
+def log_failures(
+    logger: logging.Logger,
+    label: str,
+    count: int,
+    first_error: Optional[str]
+) -> None:
+    """Log one summary record for failures collected in a request loop.
+    
+    Args:
+        logger: Logger to report to
+        label: Name of the batch the failures belong to
+        count: Number of failed requests
+        first_error: Representation of the first exception seen
+    """
+    if count:
+        logger.error("%s: %d requests failed (first error: %s)", label, count, first_error)
+
+
 class TestHarness:
     """Central orchestration for real-world testing.
     
@@ -63,13 +207,16 @@ class TestHarness:
     def __init__(
         self,
         test_root: Optional[str] = None,
-        sampling_rate: float = 1.0
+        sampling_rate: float = 1.0,
+        baseline_mode: str = "ema"
     ):
         """Initialize test harness.
         
         Args:
             test_root: Root directory for test artifacts
             sampling_rate: PIC sampling rate (1.0 = 100%)
+            baseline_mode: How testers model latency baselines
+                ("ema" for a streaming estimate, "static" for a fixed p90 threshold)
         """
         self.logger = logging.getLogger(__name__)
         
@@ -84,11 +231,19 @@ class TestHarness:
         crypto_key_path = self.safety_controller.test_root / ".crypto" / "signing.key"
         self.crypto = CryptoCore(str(crypto_key_path))
         self.sampling_rate = sampling_rate
+        self.baseline_mode = baseline_mode
         
         # Test tracking
         self.test_results: List[TestResult] = []
         self.current_test: Optional[TestResult] = None
         
+        # Warm PIC instances keyed by sandbox name
+        self._pic_instances: Dict[str, PICHandles] = {}
+        self._pic_lock = threading.Lock()
+        
+        # Established baselines shared between tests, keyed by caller
+        self._baselines: Dict[str, Any] = {}
+        
         self.logger.info("TestHarness initialized")
     
     def setup_pic_instance(self, sandbox_name: str) -> tuple[CellAgent, BrainCore]:
@@ -129,6 +284,68 @@ class TestHarness:
         
         return agent, brain
     
+    def get_pic_instance(self, sandbox_name: str) -> tuple[CellAgent, BrainCore]:
+        """Get a PIC instance for a sandbox, reusing one built earlier.
+        
+        The first request for a sandbox builds the instance with
+        setup_pic_instance(); later requests reset the agent's buffered
+        telemetry and the brain's learned state instead of rebuilding
+        storage, brain and agent.
+        
+        Args:
+            sandbox_name: Name of sandbox to use
+            
+        Returns:
+            Tuple of (CellAgent, BrainCore) instances
+        """
+        handles = self.get_pic_handles(sandbox_name)
+        return handles.agent, handles.brain
+    
+    def get_pic_handles(self, sandbox_name: str) -> PICHandles:
+        """Get the resolved components of a reusable PIC instance.
+        
+        Same pooling and reset behaviour as get_pic_instance().
+        
+        Args:
+            sandbox_name: Name of sandbox to use
+            
+        Returns:
+            PICHandles for the instance
+        """
+        with self._pic_lock:
+            handles = self._pic_instances.get(sandbox_name)
+            if handles is None:
+                handles = PICHandles.resolve(*self.setup_pic_instance(sandbox_name))
+                self._pic_instances[sandbox_name] = handles
+                return handles
+        
+        handles.agent.reset()
+        handles.brain.reset()
+        
+        return handles
+    
+    def save_baseline(self, key: str, state: Any) -> None:
+        """Share an established baseline with later tests.
+        
+        Args:
+            key: Baseline key (should encode what the baseline depends on)
+            state: Baseline state
+        """
+        with self._pic_lock:
+            self._baselines[key] = state
+    
+    def load_baseline(self, key: str) -> Optional[Any]:
+        """Get a baseline saved earlier in this run.
+        
+        Args:
+            key: Baseline key
+            
+        Returns:
+            Saved baseline state, or None if none was saved
+        """
+        with self._pic_lock:
+            return self._baselines.get(key)
+    
     def start_test(self, test_name: str, metadata: Optional[Dict[str, Any]] = None) -> TestResult:
         """Start a new test.
         
@@ -201,13 +418,33 @@ class TestHarness:
         else:
             result.false_positives += 1
     
-    def record_miss(self, result: TestResult) -> None:
-        """Record a missed detection (false negative).
+    def record_detections(
+        self,
+        result: TestResult,
+        anomaly_scores: Sequence[float],
+        is_true_positive: Sequence[bool]
+    ) -> None:
+        """Record a batch of detection events collected during a phase.
+        
+        Args:
+            result: TestResult to update
+            anomaly_scores: Anomaly score per detection
+            is_true_positive: Whether each detection was correct
+        """
+        result.anomaly_scores.extend(anomaly_scores)
+        
+        true_positives = sum(is_true_positive)
+        result.detections += true_positives
+        result.false_positives += len(is_true_positive) - true_positives
+    
+    def record_miss(self, result: TestResult, count: int = 1) -> None:
+        """Record missed detections (false negatives).
         
         Args:
             result: TestResult to update
+            count: Number of misses to record
         """
-        result.false_negatives += 1
+        result.false_negatives += count
     
     def get_summary_stats(self) -> Dict[str, Any]:
         """Get summary statistics for all tests.
@@ -224,14 +461,21 @@ class TestHarness:
                 "total_duration": 0.0
             }
         
-        passed = sum(1 for r in self.test_results if r.status == TestStatus.PASSED)
-        failed = sum(1 for r in self.test_results if r.status == TestStatus.FAILED)
-        skipped = sum(1 for r in self.test_results if r.status == TestStatus.SKIPPED)
-        
-        total_duration = sum(r.duration_seconds for r in self.test_results)
-        total_detections = sum(r.detections for r in self.test_results)
-        total_false_positives = sum(r.false_positives for r in self.test_results)
-        total_false_negatives = sum(r.false_negatives for r in self.test_results)
+        # Transpose the results into one column per field in a single pass,
+        # then reduce each column with the builtin sum
+        statuses, durations, detections, false_positives, false_negatives = zip(*(
+            (r.status, r.duration_seconds, r.detections, r.false_positives, r.false_negatives)
+            for r in self.test_results
+        ))
+        status_counts = Counter(statuses)
+        passed = status_counts[TestStatus.PASSED]
+        failed = status_counts[TestStatus.FAILED]
+        skipped = status_counts[TestStatus.SKIPPED]
+        
+        total_duration = sum(durations)
+        total_detections = sum(detections)
+        total_false_positives = sum(false_positives)
+        total_false_negatives = sum(false_negatives)
         
         # Calculate detection rate
         total_attacks = total_detections + total_false_negatives
@@ -259,6 +503,14 @@ class TestHarness:
         """Clean up all test resources."""
         self.logger.info("Cleaning up test harness...")
         
+        # Release pooled PIC instances
+        with self._pic_lock:
+            for handles in self._pic_instances.values():
+                handles.brain.state_store.close()
+                handles.brain.audit_store.close()
+            self._pic_instances.clear()
+            self._baselines.clear()
+        
         # Cleanup sandboxes
         self.sandbox_manager.cleanup_all_sandboxes()
         
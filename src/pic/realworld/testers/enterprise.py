@@ -6,10 +6,16 @@ No fluff. Just facts.
 
 import time
 import logging
+import threading
 from typing import Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
 from pic.cellagent import CellAgent
 from ..safety import SafetyController
-from ..harness import TestHarness
+from ..harness import TestHarness, log_failures, patched_attributes
+
+# Returned by simulated requests; callers only check for a non-None result
+_OK = object()
 
 
 class EnterpriseSecurityTester:
@@ -36,14 +42,21 @@ class EnterpriseSecurityTester:
         """
         self.logger.info("[ENTERPRISE] Starting fail-open vs fail-closed tests")
         
-        results = {
-            "detector_crash": self._test_detector_crash(),
-            "effector_stall": self._test_effector_stall(),
-            "safety_trip": self._test_safety_trip(),
-            "storage_failure": self._test_storage_failure(),
-            "network_partition": self._test_network_partition()
+        scenarios = {
+            "detector_crash": self._test_detector_crash,
+            "effector_stall": self._test_effector_stall,
+            "safety_trip": self._test_safety_trip,
+            "storage_failure": self._test_storage_failure,
+            "network_partition": self._test_network_partition
         }
         
+        # Scenarios use independent PIC instances and are dominated by
+        # sleeps, so run them concurrently (threads keep the shared
+        # harness and its sandbox bookkeeping in one process)
+        with ThreadPoolExecutor(max_workers=len(scenarios)) as executor:
+            futures = {name: executor.submit(run) for name, run in scenarios.items()}
+            results = {name: future.result() for name, future in futures.items()}
+        
         # Calculate overall failure behavior
         fail_open_count = sum(1 for r in results.values() if r.get("behavior") == "fail_open")
         fail_closed_count = sum(1 for r in results.values() if r.get("behavior") == "fail_closed")
@@ -62,45 +75,57 @@ class EnterpriseSecurityTester:
         """Test detector process crash behavior."""
         self.logger.info("[TEST] Detector crash simulation")
         
-        start_time = time.time()
-        agent, brain = self.harness.setup_pic_instance("detector_crash_test")
+        start_ns = time.perf_counter_ns()
+        faults = ExitStack()
+        pic = self.harness.get_pic_handles("detector_crash_test")
+        agent = pic.agent
         
         # Send normal traffic
+        @agent.monitor
+        def normal_request():
+            time.sleep(0.01)
+            return _OK
+        
         normal_requests = 0
+        error_count = 0
+        first_error = None
         for i in range(10):
             try:
-                @agent.monitor
-                def normal_request():
-                    time.sleep(0.01)
-                    return f"response_{i}"
-                
                 result = normal_request()
                 if result is not None:
                     normal_requests += 1
             except Exception as e:
-                self.logger.error(f"Normal request failed: {e}")
+                error_count += 1
+                first_error = first_error or repr(e)
+        
+        log_failures(self.logger, "Normal requests", error_count, first_error)
         
         # Simulate detector crash
         try:
-            brain._detector = None
+            faults.enter_context(patched_attributes(pic.brain, detector=None))
+            
+            @agent.monitor
+            def post_crash_request():
+                time.sleep(0.01)
+                return _OK
             
             post_crash_requests = 0
+            error_count = 0
+            first_error = None
             for i in range(10):
                 try:
-                    @agent.monitor
-                    def post_crash_request():
-                        time.sleep(0.01)
-                        return f"post_crash_{i}"
-                    
                     result = post_crash_request()
                     if result is not None:
                         post_crash_requests += 1
                 except Exception as e:
-                    self.logger.error(f"Post-crash request failed: {e}")
+                    error_count += 1
+                    first_error = first_error or repr(e)
+            
+            log_failures(self.logger, "Post-crash requests", error_count, first_error)
             
             behavior = "fail_open" if post_crash_requests > 0 else "fail_closed"
             safety_level = "LOW" if post_crash_requests > 0 else "HIGH"
-            duration = time.time() - start_time
+            duration = (time.perf_counter_ns() - start_ns) / 1e9
             
             return {
                 "scenario": "detector_crash",
@@ -119,45 +144,61 @@ class EnterpriseSecurityTester:
                 "error": str(e),
                 "passed": False
             }
+        finally:
+            # Undo the simulated fault so the reused instance stays healthy
+            faults.close()
 
     def _test_effector_stall(self) -> Dict[str, Any]:
         """Test effector stall behavior."""
         self.logger.info("[TEST] Effector stall simulation")
         
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
+        faults = ExitStack()
         try:
-            agent, brain = self.harness.setup_pic_instance("effector_stall_test")
+            pic = self.harness.get_pic_handles("effector_stall_test")
+            agent = pic.agent
+            
+            # Released once the first stall has been observed so the
+            # remaining requests don't each block for the full timeout
+            stall_released = threading.Event()
             
             def stalled_execute(decision):
-                time.sleep(10)
+                stall_released.wait(10)
                 return None
             
-            if hasattr(brain, '_effector') and brain._effector:
-                brain._effector.execute = stalled_execute
+            if pic.effector:
+                faults.enter_context(patched_attributes(pic.effector, execute=stalled_execute))
+            
+            @agent.monitor
+            def stalled_request():
+                time.sleep(0.01)
+                return _OK
             
             stalled_requests = 0
             request_times = []
+            error_count = 0
+            first_error = None
             
             for i in range(5):
-                req_start = time.time()
+                req_start_ns = time.perf_counter_ns()
                 try:
-                    @agent.monitor
-                    def stalled_request():
-                        time.sleep(0.01)
-                        return f"stalled_{i}"
-                    
                     result = stalled_request()
-                    req_end = time.time()
-                    request_times.append(req_end - req_start)
+                    request_times.append(time.perf_counter_ns() - req_start_ns)
                     
                     if result is not None:
                         stalled_requests += 1
                 except Exception as e:
-                    self.logger.error(f"Stalled request failed: {e}")
-                    req_end = time.time()
-                    request_times.append(req_end - req_start)
+                    error_count += 1
+                    first_error = first_error or repr(e)
+                    request_times.append(time.perf_counter_ns() - req_start_ns)
+                finally:
+                    stall_released.set()
             
-            avg_response_time = sum(request_times) / len(request_times) if request_times else 0
+            log_failures(self.logger, "Stalled requests", error_count, first_error)
+            
+            avg_response_time = (
+                sum(request_times) / len(request_times) / 1e9 if request_times else 0
+            )
             
             if stalled_requests > 0 and avg_response_time < 1.0:
                 behavior = "fail_open"
@@ -169,7 +210,7 @@ class EnterpriseSecurityTester:
                 behavior = "degraded"
                 safety_level = "MEDIUM"
             
-            duration = time.time() - start_time
+            duration = (time.perf_counter_ns() - start_ns) / 1e9
             
             return {
                 "scenario": "effector_stall",
@@ -188,14 +229,17 @@ class EnterpriseSecurityTester:
                 "error": str(e),
                 "passed": False
             }
+        finally:
+            # Undo the simulated fault so the reused instance stays healthy
+            faults.close()
 
     def _test_safety_trip(self) -> Dict[str, Any]:
         """Test safety controller trip behavior."""
         self.logger.info("[TEST] Safety controller trip simulation")
         
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         try:
-            agent, brain = self.harness.setup_pic_instance("safety_trip_test")
+            agent, brain = self.harness.get_pic_instance("safety_trip_test")
             safety = self.harness.safety_controller
             
             safety_triggered = False
@@ -205,19 +249,24 @@ class EnterpriseSecurityTester:
                 safety_triggered = True
                 self.logger.info(f"Safety controller triggered: {e}")
             
+            @agent.monitor
+            def post_trip_request():
+                time.sleep(0.01)
+                return _OK
+            
             post_trip_requests = 0
+            error_count = 0
+            first_error = None
             for i in range(5):
                 try:
-                    @agent.monitor
-                    def post_trip_request():
-                        time.sleep(0.01)
-                        return f"post_trip_{i}"
-                    
                     result = post_trip_request()
                     if result is not None:
                         post_trip_requests += 1
                 except Exception as e:
-                    self.logger.error(f"Post-trip request failed: {e}")
+                    error_count += 1
+                    first_error = first_error or repr(e)
+            
+            log_failures(self.logger, "Post-trip requests", error_count, first_error)
             
             if safety_triggered and post_trip_requests == 0:
                 behavior = "fail_closed"
@@ -229,7 +278,7 @@ class EnterpriseSecurityTester:
                 behavior = "inconsistent"
                 safety_level = "CRITICAL"
             
-            duration = time.time() - start_time
+            duration = (time.perf_counter_ns() - start_ns) / 1e9
             
             return {
                 "scenario": "safety_trip",
@@ -253,32 +302,41 @@ class EnterpriseSecurityTester:
         """Test storage system failure behavior."""
         self.logger.info("[TEST] Storage failure simulation")
         
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
+        faults = ExitStack()
         try:
-            agent, brain = self.harness.setup_pic_instance("storage_failure_test")
+            pic = self.harness.get_pic_handles("storage_failure_test")
+            agent = pic.agent
             
-            if hasattr(brain, '_state_store'):
-                def failing_store(key, value):
+            if pic.state_store:
+                def failing_store(*args, **kwargs):
                     raise Exception("Storage failure simulated")
-                brain._state_store.store = failing_store
+                faults.enter_context(
+                    patched_attributes(pic.state_store, store_baseline=failing_store)
+                )
+            
+            @agent.monitor
+            def storage_fail_request():
+                time.sleep(0.01)
+                return _OK
             
             storage_fail_requests = 0
+            error_count = 0
+            first_error = None
             for i in range(5):
                 try:
-                    @agent.monitor
-                    def storage_fail_request():
-                        time.sleep(0.01)
-                        return f"storage_fail_{i}"
-                    
                     result = storage_fail_request()
                     if result is not None:
                         storage_fail_requests += 1
                 except Exception as e:
-                    self.logger.error(f"Storage fail request failed: {e}")
+                    error_count += 1
+                    first_error = first_error or repr(e)
+            
+            log_failures(self.logger, "Storage failure requests", error_count, first_error)
             
             behavior = "fail_open" if storage_fail_requests > 0 else "fail_closed"
             safety_level = "MEDIUM" if storage_fail_requests > 0 else "HIGH"
-            duration = time.time() - start_time
+            duration = (time.perf_counter_ns() - start_ns) / 1e9
             
             return {
                 "scenario": "storage_failure",
@@ -296,35 +354,43 @@ class EnterpriseSecurityTester:
                 "error": str(e),
                 "passed": False
             }
+        finally:
+            # Undo the simulated fault so the reused instance stays healthy
+            faults.close()
     
     def _test_network_partition(self) -> Dict[str, Any]:
         """Test network partition behavior."""
         self.logger.info("[TEST] Network partition simulation")
         
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         try:
-            agent, brain = self.harness.setup_pic_instance("network_partition_test")
+            agent, brain = self.harness.get_pic_instance("network_partition_test")
             partition_active = True
             
+            @agent.monitor
+            def partition_request():
+                if partition_active:
+                    time.sleep(0.1)
+                time.sleep(0.01)
+                return _OK
+            
             partition_requests = 0
+            error_count = 0
+            first_error = None
             for i in range(5):
                 try:
-                    @agent.monitor
-                    def partition_request():
-                        if partition_active:
-                            time.sleep(0.1)
-                        time.sleep(0.01)
-                        return f"partition_{i}"
-                    
                     result = partition_request()
                     if result is not None:
                         partition_requests += 1
                 except Exception as e:
-                    self.logger.error(f"Partition request failed: {e}")
+                    error_count += 1
+                    first_error = first_error or repr(e)
+            
+            log_failures(self.logger, "Partition requests", error_count, first_error)
             
             behavior = "fail_open" if partition_requests > 0 else "fail_closed"
             safety_level = "MEDIUM" if partition_requests > 0 else "HIGH"
-            duration = time.time() - start_time
+            duration = (time.perf_counter_ns() - start_ns) / 1e9
             
             return {
                 "scenario": "network_partition",
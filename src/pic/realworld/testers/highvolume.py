@@ -4,17 +4,54 @@ Real-world high-volume performance validation.
 Tests PIC under sustained load conditions.
 """
 
+import math
 import time
 import logging
 import threading
+from array import array
 from pathlib import Path
-from typing import Dict, Any, List
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Any, List, Sequence
+from concurrent.futures import ThreadPoolExecutor, wait
 import statistics
 
 from pic.cellagent import CellAgent
 from pic.realworld.safety import SafetyController
-from pic.realworld.harness import TestHarness
+from pic.realworld.harness import TestHarness, log_failures
+
+_NS_PER_SEC = 1_000_000_000
+_NS_PER_MS = 1_000_000
+
+# Returned by simulated requests; callers only check for a non-None result
+_OK = object()
+
+# Bounds on a calibrated worker pool. Requests take ~1.1ms, so 4 workers
+# sustain ~3,400 rps: 34x the sustained-load target, and a 500-request
+# burst clears in ~0.15s with lower per-request latency than 50 workers
+MIN_WORKERS = 4
+MAX_WORKERS = 64
+
+
+def _percentiles(samples: Sequence[float], percents: Sequence[float]) -> List[float]:
+    """Compute several percentiles from a single sort of the samples.
+    
+    Uses linear interpolation between closest ranks.
+    
+    Args:
+        samples: Latency samples
+        percents: Percentiles to compute (0-100)
+        
+    Returns:
+        List of percentile values in the order requested
+    """
+    ordered = sorted(samples)
+    last = len(ordered) - 1
+    values = []
+    for pct in percents:
+        rank = last * pct / 100.0
+        lower = int(rank)
+        upper = min(lower + 1, last)
+        values.append(ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower))
+    return values
 
 
 class HighVolumeTester:
@@ -40,10 +77,10 @@ class HighVolumeTester:
         """
         self.logger.info("[HIGH-VOLUME] Starting sustained load test")
         
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         
-        # Setup PIC instance
-        agent, brain = self.harness.setup_pic_instance("sustained_load_test")
+        # Shared PIC instance (reset between tests by the harness)
+        agent, brain = self.harness.get_pic_instance("high_volume_test")
         
         # Test parameters
         duration_seconds = 30
@@ -51,12 +88,15 @@ class HighVolumeTester:
         total_requests = duration_seconds * target_rps
         
         # Track metrics
-        request_times = []
+        request_times = array('q')
         successful_requests = 0
         failed_requests = 0
+        error_count = 0
+        first_error = None
         
         # Run sustained load
-        with ThreadPoolExecutor(max_workers=10) as executor:
+        workers = self._calibrate_workers(agent, target_rps)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
             futures = []
             
             for i in range(total_requests):
@@ -67,26 +107,34 @@ class HighVolumeTester:
                 if (i + 1) % target_rps == 0:
                     time.sleep(1.0)
             
-            # Collect results
-            for future in as_completed(futures):
+            # Drain results once everything has finished
+            wait(futures)
+            for future in futures:
                 try:
-                    req_time, success = future.result()
-                    request_times.append(req_time)
+                    req_ns, success = future.result()
+                    request_times.append(req_ns)
                     if success:
                         successful_requests += 1
                     else:
                         failed_requests += 1
                 except Exception as e:
-                    self.logger.error(f"Request failed: {e}")
                     failed_requests += 1
-        
-        duration = time.time() - start_time
-        
-        # Calculate metrics
-        avg_latency = statistics.mean(request_times) if request_times else 0
-        p50_latency = statistics.median(request_times) if request_times else 0
-        p95_latency = statistics.quantiles(request_times, n=20)[18] if len(request_times) > 20 else 0
-        p99_latency = statistics.quantiles(request_times, n=100)[98] if len(request_times) > 100 else 0
+                    error_count += 1
+                    first_error = first_error or repr(e)
+        
+        log_failures(self.logger, "Sustained load", error_count, first_error)
+        duration = (time.perf_counter_ns() - start_ns) / _NS_PER_SEC
+        
+        # Calculate metrics (single sort for all percentiles)
+        avg_latency = statistics.fmean(request_times) / _NS_PER_SEC if request_times else 0
+        p50_latency, p95_latency, p99_latency = (
+            [p / _NS_PER_SEC for p in _percentiles(request_times, (50, 95, 99))]
+            if request_times else (0, 0, 0)
+        )
+        if len(request_times) <= 20:
+            p95_latency = 0
+        if len(request_times) <= 100:
+            p99_latency = 0
         actual_rps = total_requests / duration
         success_rate = (successful_requests / total_requests) * 100 if total_requests > 0 else 0
         
@@ -99,6 +147,7 @@ class HighVolumeTester:
             "success_rate_percent": success_rate,
             "target_rps": target_rps,
             "actual_rps": actual_rps,
+            "workers": workers,
             "avg_latency_ms": avg_latency * 1000,
             "p50_latency_ms": p50_latency * 1000,
             "p95_latency_ms": p95_latency * 1000,
@@ -113,10 +162,10 @@ class HighVolumeTester:
         """
         self.logger.info("[HIGH-VOLUME] Starting burst traffic test")
         
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         
-        # Setup PIC instance
-        agent, brain = self.harness.setup_pic_instance("burst_traffic_test")
+        # Shared PIC instance (reset between tests by the harness)
+        agent, brain = self.harness.get_pic_instance("high_volume_test")
         
         # Test parameters
         burst_size = 500
@@ -124,30 +173,38 @@ class HighVolumeTester:
         
         burst_results = []
         
+        # Size the pool to clear a whole burst in about a second
+        workers = self._calibrate_workers(agent, burst_size)
+        
         for burst_num in range(burst_count):
             self.logger.info(f"[HIGH-VOLUME] Burst {burst_num + 1}/{burst_count}")
             
-            burst_start = time.time()
-            request_times = []
+            burst_start_ns = time.perf_counter_ns()
+            request_times = array('q')
             successful = 0
+            error_count = 0
+            first_error = None
             
             # Send burst
-            with ThreadPoolExecutor(max_workers=50) as executor:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
                 futures = [
                     executor.submit(self._send_request, agent, i)
                     for i in range(burst_size)
                 ]
                 
-                for future in as_completed(futures):
+                wait(futures)
+                for future in futures:
                     try:
-                        req_time, success = future.result()
-                        request_times.append(req_time)
+                        req_ns, success = future.result()
+                        request_times.append(req_ns)
                         if success:
                             successful += 1
                     except Exception as e:
-                        self.logger.error(f"Burst request failed: {e}")
+                        error_count += 1
+                        first_error = first_error or repr(e)
             
-            burst_duration = time.time() - burst_start
+            log_failures(self.logger, f"Burst {burst_num + 1}", error_count, first_error)
+            burst_duration = (time.perf_counter_ns() - burst_start_ns) / _NS_PER_SEC
             burst_rps = burst_size / burst_duration
             
             burst_results.append({
@@ -156,25 +213,26 @@ class HighVolumeTester:
                 "successful": successful,
                 "duration_seconds": burst_duration,
                 "rps": burst_rps,
-                "avg_latency_ms": statistics.mean(request_times) * 1000 if request_times else 0
+                "avg_latency_ms": statistics.fmean(request_times) / _NS_PER_MS if request_times else 0
             })
             
             # Cool down between bursts
             time.sleep(2.0)
         
-        duration = time.time() - start_time
+        duration = (time.perf_counter_ns() - start_ns) / _NS_PER_SEC
         
         # Calculate overall metrics
         total_requests = burst_size * burst_count
         total_successful = sum(b["successful"] for b in burst_results)
         success_rate = (total_successful / total_requests) * 100
-        avg_burst_rps = statistics.mean([b["rps"] for b in burst_results])
+        avg_burst_rps = statistics.fmean(b["rps"] for b in burst_results)
         
         return {
             "test_name": "burst_traffic",
             "duration_seconds": duration,
             "burst_count": burst_count,
             "burst_size": burst_size,
+            "workers": workers,
             "total_requests": total_requests,
             "total_successful": total_successful,
             "success_rate_percent": success_rate,
@@ -190,10 +248,10 @@ class HighVolumeTester:
         """
         self.logger.info("[HIGH-VOLUME] Starting concurrent streams test")
         
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         
-        # Setup PIC instance
-        agent, brain = self.harness.setup_pic_instance("concurrent_streams_test")
+        # Shared PIC instance (reset between tests by the harness)
+        agent, brain = self.harness.get_pic_instance("high_volume_test")
         
         # Test parameters
         stream_count = 10
@@ -203,48 +261,53 @@ class HighVolumeTester:
         
         def run_stream(stream_id: int) -> Dict[str, Any]:
             """Run a single data stream."""
-            stream_start = time.time()
-            request_times = []
+            stream_start_ns = time.perf_counter_ns()
+            request_times = array('q')
             successful = 0
             
             for i in range(requests_per_stream):
-                req_time, success = self._send_request(agent, f"stream_{stream_id}_req_{i}")
-                request_times.append(req_time)
+                req_ns, success = self._send_request(agent, f"stream_{stream_id}_req_{i}")
+                request_times.append(req_ns)
                 if success:
                     successful += 1
                 time.sleep(0.01)  # Small delay between requests
             
-            stream_duration = time.time() - stream_start
+            stream_duration = (time.perf_counter_ns() - stream_start_ns) / _NS_PER_SEC
             
             return {
                 "stream_id": stream_id,
                 "requests": requests_per_stream,
                 "successful": successful,
                 "duration_seconds": stream_duration,
-                "avg_latency_ms": statistics.mean(request_times) * 1000 if request_times else 0
+                "avg_latency_ms": statistics.fmean(request_times) / _NS_PER_MS if request_times else 0
             }
         
         # Run streams concurrently
+        error_count = 0
+        first_error = None
         with ThreadPoolExecutor(max_workers=stream_count) as executor:
             futures = [
                 executor.submit(run_stream, stream_id)
                 for stream_id in range(stream_count)
             ]
             
-            for future in as_completed(futures):
+            wait(futures)
+            for future in futures:
                 try:
                     result = future.result()
                     stream_results.append(result)
                 except Exception as e:
-                    self.logger.error(f"Stream failed: {e}")
+                    error_count += 1
+                    first_error = first_error or repr(e)
         
-        duration = time.time() - start_time
+        log_failures(self.logger, "Concurrent streams", error_count, first_error)
+        duration = (time.perf_counter_ns() - start_ns) / _NS_PER_SEC
         
         # Calculate overall metrics
         total_requests = stream_count * requests_per_stream
         total_successful = sum(s["successful"] for s in stream_results)
         success_rate = (total_successful / total_requests) * 100
-        avg_stream_latency = statistics.mean([s["avg_latency_ms"] for s in stream_results])
+        avg_stream_latency = statistics.fmean(s["avg_latency_ms"] for s in stream_results)
         
         return {
             "test_name": "concurrent_streams",
@@ -263,22 +326,45 @@ class HighVolumeTester:
         """Send a single request and measure time.
         
         Returns:
-            Tuple of (request_time, success)
+            Tuple of (request_time_ns, success)
         """
-        start = time.time()
+        start_ns = time.perf_counter_ns()
         try:
             @agent.monitor
             def test_request():
                 # Simulate some work
                 time.sleep(0.001)
-                return f"response_{request_id}"
+                return _OK
             
             result = test_request()
-            duration = time.time() - start
-            return (duration, result is not None)
+            return (time.perf_counter_ns() - start_ns, result is not None)
         except Exception as e:
-            duration = time.time() - start
-            return (duration, False)
+            return (time.perf_counter_ns() - start_ns, False)
+    
+    def _calibrate_workers(self, agent: CellAgent, target_rps: float, samples: int = 50) -> int:
+        """Size a worker pool from measured request latency.
+        
+        Uses Little's Law (concurrency = arrival rate x mean latency), clamped
+        to MIN_WORKERS-MAX_WORKERS so calibration noise can't starve or flood
+        the pool. Tests report the chosen size in their results.
+        
+        Args:
+            agent: CellAgent to send calibration requests through
+            target_rps: Request rate the pool has to sustain
+            samples: Number of sequential calibration requests
+            
+        Returns:
+            Number of worker threads to use
+        """
+        total_ns = sum(self._send_request(agent, f"calibrate_{i}")[0] for i in range(samples))
+        mean_latency = total_ns / samples / _NS_PER_SEC
+        workers = max(MIN_WORKERS, min(MAX_WORKERS, math.ceil(target_rps * mean_latency)))
+        
+        self.logger.info(
+            "[HIGH-VOLUME] Using %d workers (%.0f rps x %.2f ms mean latency)",
+            workers, target_rps, mean_latency * 1000
+        )
+        return workers
     
     def run_all_tests(self) -> Dict[str, Any]:
         """Run all high-volume tests.
@@ -3,19 +3,135 @@
 Tests PIC's ability to detect sudden latency spikes and performance degradation.
 """
 
+import math
 import time
 import random
-from typing import List, Callable, Any
-from dataclasses import dataclass
+import statistics
+from typing import List, Callable, Any, Sequence, Tuple
+from dataclasses import dataclass, asdict
+from concurrent.futures import ThreadPoolExecutor
 import logging
 
-from pic.realworld.harness import TestHarness, TestStatus
+from pic.realworld.harness import TestHarness, TestStatus, pinned_to_cpu
 from pic.cellagent import CellAgent
 
+# Anomaly levels exercised by the scoring test, as multiples of baseline
+ANOMALY_MULTIPLIERS = (2, 5, 10, 20)
 
-@dataclass
+# Smoothing factor for the streaming latency baseline (~200-sample memory)
+EMA_ALPHA = 2.0 / (1 + 200)
+
+
+def _ema_update(mu: float, s: float, y: float, alpha: float = EMA_ALPHA) -> Tuple[float, float]:
+    """Advance an exponentially weighted mean/variance estimate by one sample.
+    
+    O(1) state replaces keeping the full sample history.
+    
+    Args:
+        mu: Current mean
+        s: Current variance
+        y: New sample
+        alpha: Smoothing factor
+        
+    Returns:
+        Tuple of (mean, variance) after the update
+    """
+    d = y - mu
+    return mu + alpha * d, (1 - alpha) * (s + alpha * d * d)
+
+
+def _ema_baseline(samples: Sequence[float], alpha: float = EMA_ALPHA) -> Tuple[float, float]:
+    """Fold latency samples into an EMA (mean, variance) baseline."""
+    mu, s = samples[0], 0.0
+    for y in samples[1:]:
+        mu, s = _ema_update(mu, s, y, alpha)
+    return mu, s
+
+
+def _baseline_stats(samples: Sequence[float]) -> Tuple[float, float, float]:
+    """Summarise baseline latencies.
+    
+    Args:
+        samples: Baseline latencies in milliseconds
+        
+    Returns:
+        Tuple of (EMA mean, EMA variance, p90)
+    """
+    mu, s = _ema_baseline(samples)
+    if len(samples) < 2:
+        # quantiles() needs two points; a lone sample is its own p90
+        p90 = samples[0]
+    else:
+        p90 = statistics.quantiles(samples, n=10, method="inclusive")[-1]
+    return mu, s, p90
+
+
+def _ema_step(
+    mu: float,
+    s: float,
+    y: float,
+    alpha: float = EMA_ALPHA
+) -> Tuple[float, float, float]:
+    """Score a sample against an EMA baseline, then fold it in.
+    
+    The z-score against the pre-update estimate is mapped through a
+    logistic curve centred on 3 sigma, so in-baseline samples score near
+    0 and clear outliers near 1.
+    
+    Args:
+        mu: Current mean
+        s: Current variance
+        y: New sample
+        alpha: Smoothing factor
+        
+    Returns:
+        Tuple of (mean, variance, score)
+    """
+    score = 1.0 / (1.0 + math.exp(3.0 - abs(y - mu) / math.sqrt(s + 1e-12)))
+    return (*_ema_update(mu, s, y, alpha), score)
+
+
+def _ema_recovered(
+    baseline: Tuple[float, float],
+    peak_mu: float,
+    mu: float,
+    steps: int,
+    alpha: float = EMA_ALPHA
+) -> bool:
+    """Check that an EMA mean decayed back toward its pre-anomaly baseline.
+    
+    Each normal sample closes an alpha fraction of the remaining shift, so
+    after steps of them at most (1 - alpha) ** steps of the shift the
+    anomalies caused may remain, plus 3 sigma of baseline noise.
+    
+    Args:
+        baseline: Pre-anomaly (mean, variance)
+        peak_mu: Mean after the anomalies, before recovery
+        mu: Mean after the recovery samples
+        steps: Number of recovery samples folded in
+        alpha: Smoothing factor
+        
+    Returns:
+        True if the mean recovered at least at the EMA's decay rate
+    """
+    mu0, s0 = baseline
+    allowed = abs(peak_mu - mu0) * (1 - alpha) ** steps + 3 * math.sqrt(s0)
+    return abs(mu - mu0) <= allowed
+
+
+def _timed_call(func: Callable, arg: Any) -> Tuple[Any, float]:
+    """Call func(arg) and return (result, latency_ms)."""
+    start = time.perf_counter()
+    output = func(arg)
+    return output, (time.perf_counter() - start) * 1000.0
+
+
+@dataclass(frozen=True)
 class LatencyTestConfig:
-    """Configuration for latency anomaly tests."""
+    """Configuration for latency anomaly tests.
+    
+    Frozen so one default instance can be shared and configs can be hashed.
+    """
     baseline_samples: int = 30
     baseline_latency_ms: float = 50.0
     anomaly_latency_ms: float = 2000.0
@@ -23,6 +139,9 @@ class LatencyTestConfig:
     recovery_samples: int = 10
 
 
+_DEFAULT_CONFIG = LatencyTestConfig()
+
+
 class LatencyAnomalyTester:
     """Tests PIC's latency anomaly detection capabilities.
     
@@ -47,19 +166,84 @@ class LatencyAnomalyTester:
     def run_all_tests(self) -> List[Any]:
         """Run all latency anomaly tests.
         
+        The baseline establishment test runs first so that the remaining
+        tests can reuse its baseline; those are sleep-bound and independent,
+        so they then run concurrently, each on its own PIC instance.
+        Baseline and measurement phases both run pinned to one CPU, so the
+        latencies they compare are taken under the same scheduling.
+        
         Returns:
             List of test results
         """
-        results = []
+        results = [self.test_baseline_establishment()]
         
-        results.append(self.test_baseline_establishment())
-        results.append(self.test_latency_spike_detection())
-        results.append(self.test_anomaly_scoring())
-        results.append(self.test_effector_response())
-        results.append(self.test_baseline_recovery())
+        tests = (
+            self.test_latency_spike_detection,
+            self.test_anomaly_scoring,
+            self.test_effector_response,
+            self.test_baseline_recovery,
+        )
+        with ThreadPoolExecutor(max_workers=len(tests)) as executor:
+            futures = [executor.submit(test) for test in tests]
+        results.extend(future.result() for future in futures)
         
         return results
     
+    def _run_baseline(self, func: Callable, inputs: List[Any]) -> List[Tuple[Any, float]]:
+        """Run baseline calls concurrently.
+        
+        Baseline calls are sleep-bound, so issuing them from a thread pool
+        keeps each observed latency intact while the phase takes roughly
+        one call's worth of wall-clock time.
+        
+        Args:
+            func: Monitored function to call
+            inputs: One argument per call
+            
+        Returns:
+            (result, latency_ms) pairs in input order
+        """
+        with pinned_to_cpu(), ThreadPoolExecutor(max_workers=max(1, len(inputs))) as executor:
+            return list(executor.map(_timed_call, [func] * len(inputs), inputs))
+    
+    @staticmethod
+    def _baseline_key(config: LatencyTestConfig) -> str:
+        """Harness key for the baseline latencies config produces."""
+        return f"latency_{config.baseline_latency_ms}ms_x{config.baseline_samples}"
+    
+    def _shared_baseline(
+        self,
+        agent: CellAgent,
+        func: Callable,
+        inputs: List[Any],
+        config: LatencyTestConfig
+    ) -> Tuple[float, float, float]:
+        """Get the baseline for config, running the baseline phase only once per run.
+        
+        Every test targets the same baseline latency, so the first test to
+        run the baseline phase saves its latencies on the harness. Later
+        tests seed their own function's baseline from those latencies
+        instead of repeating the phase.
+        
+        Args:
+            agent: Agent monitoring func
+            func: Monitored function to establish a baseline for
+            inputs: One argument per baseline call
+            config: Test configuration
+            
+        Returns:
+            Tuple of (EMA mean, EMA variance, p90) in milliseconds
+        """
+        key = self._baseline_key(config)
+        latencies = self.harness.load_baseline(key)
+        if latencies is None:
+            outputs = self._run_baseline(func, inputs)
+            latencies = tuple(latency for _, latency in outputs)
+            self.harness.save_baseline(key, latencies)
+        else:
+            agent.seed_baseline(func, latencies, inputs[0])
+        return _baseline_stats(latencies)
+    
     def test_baseline_establishment(self, config: LatencyTestConfig = None) -> Any:
         """Test that PIC establishes baseline for consistent functions.
         
@@ -72,15 +256,15 @@ class LatencyAnomalyTester:
         Returns:
             Test result
         """
-        config = config or LatencyTestConfig()
+        config = config or _DEFAULT_CONFIG
         result = self.harness.start_test(
             "latency_baseline_establishment",
-            metadata={"config": config.__dict__}
+            metadata={"config": asdict(config)}
         )
         
         try:
             # Set up PIC instance
-            agent, brain = self.harness.setup_pic_instance("latency_baseline")
+            agent, brain = self.harness.get_pic_instance("latency_baseline")
             
             # Create monitored function with consistent latency
             @agent.monitor
@@ -90,15 +274,21 @@ class LatencyAnomalyTester:
                 return f"processed: {data}"
             
             # Execute baseline samples
-            for i in range(config.baseline_samples):
-                result_data = consistent_function(f"sample_{i}")
+            baseline_outputs = self._run_baseline(
+                consistent_function,
+                [f"sample_{i}" for i in range(config.baseline_samples)]
+            )
+            for i, (result_data, _) in enumerate(baseline_outputs):
                 if result_data is None:
                     # PIC blocked - shouldn't happen during baseline
                     self.logger.warning(f"Unexpected block during baseline: sample {i}")
+            self.harness.save_baseline(
+                self._baseline_key(config),
+                tuple(latency for _, latency in baseline_outputs)
+            )
             
-            # Verify baseline was established
-            # Check that function has baseline in brain's state
-            function_key = f"{consistent_function.__module__}.{consistent_function.__name__}"
+            # Record which monitored function the baseline belongs to
+            result.metadata["function_key"] = consistent_function._pic_key
             
             # For now, we consider test passed if no exceptions occurred
             # In full implementation, we'd query brain state to verify baseline
@@ -123,15 +313,15 @@ class LatencyAnomalyTester:
         Returns:
             Test result
         """
-        config = config or LatencyTestConfig()
+        config = config or _DEFAULT_CONFIG
         result = self.harness.start_test(
             "latency_spike_detection",
-            metadata={"config": config.__dict__}
+            metadata={"config": asdict(config)}
         )
         
         try:
             # Set up PIC instance
-            agent, brain = self.harness.setup_pic_instance("latency_spike")
+            agent, brain = self.harness.get_pic_instance("latency_spike")
             
             # Create function that will have latency spike
             spike_triggered = False
@@ -151,24 +341,29 @@ class LatencyAnomalyTester:
                 return f"processed: {data}"
             
             # Establish baseline
-            for i in range(config.baseline_samples):
-                variable_latency_function(f"baseline_{i}")
+            self._shared_baseline(
+                agent,
+                variable_latency_function,
+                [f"baseline_{i}" for i in range(config.baseline_samples)],
+                config
+            )
             
             # Trigger latency spikes
             spike_triggered = True
             detections = 0
             
-            for i in range(config.anomaly_count):
-                result_data = variable_latency_function(f"spike_{i}")
-                
-                # If PIC blocked the call, it detected the anomaly
-                if result_data is None:
-                    detections += 1
-                    self.harness.record_detection(result, anomaly_score=0.9, is_true_positive=True)
-                else:
-                    # PIC didn't block - might still have detected but allowed
-                    # For now, we count this as a miss
-                    self.harness.record_miss(result)
+            with pinned_to_cpu():
+                for i in range(config.anomaly_count):
+                    result_data = variable_latency_function(f"spike_{i}")
+                    
+                    # If PIC blocked the call, it detected the anomaly
+                    if result_data is None:
+                        detections += 1
+            
+            # PIC didn't block the rest - might still have detected but allowed
+            # For now, we count those as misses
+            self.harness.record_detections(result, [0.9] * detections, [True] * detections)
+            self.harness.record_miss(result, config.anomaly_count - detections)
             
             # Test passes if we detected at least some spikes
             # In production, we'd want higher detection rate
@@ -199,15 +394,15 @@ class LatencyAnomalyTester:
         Returns:
             Test result
         """
-        config = config or LatencyTestConfig()
+        config = config or _DEFAULT_CONFIG
         result = self.harness.start_test(
             "latency_anomaly_scoring",
-            metadata={"config": config.__dict__}
+            metadata={"config": asdict(config)}
         )
         
         try:
             # Set up PIC instance
-            agent, brain = self.harness.setup_pic_instance("latency_scoring")
+            agent, brain = self.harness.get_pic_instance("latency_scoring")
             
             # Create function with varying latencies
             @agent.monitor
@@ -217,40 +412,43 @@ class LatencyAnomalyTester:
                 return f"processed with {latency_ms}ms latency"
             
             # Establish baseline with normal latency
-            for i in range(config.baseline_samples):
-                scored_function(config.baseline_latency_ms)
-            
-            # Test various anomaly levels
-            test_latencies = [
-                config.baseline_latency_ms * 2,   # 2x baseline
-                config.baseline_latency_ms * 5,   # 5x baseline
-                config.baseline_latency_ms * 10,  # 10x baseline
-                config.baseline_latency_ms * 20,  # 20x baseline
-            ]
-            
-            for latency in test_latencies:
-                result_data = scored_function(latency)
-                
-                # Record detection with estimated score based on latency multiplier
-                multiplier = latency / config.baseline_latency_ms
-                estimated_score = min(0.5 + (multiplier / 40.0), 1.0)
-                
-                if result_data is None:
-                    # Blocked - high score
-                    self.harness.record_detection(result, anomaly_score=0.9, is_true_positive=True)
-                else:
-                    # Not blocked - lower score or no detection
-                    self.harness.record_detection(result, anomaly_score=estimated_score, is_true_positive=False)
+            mu, s, p90 = self._shared_baseline(
+                agent,
+                scored_function,
+                [config.baseline_latency_ms] * config.baseline_samples,
+                config
+            )
+            
+            # Precompute the anomaly schedule and its p90-relative scores
+            test_latencies = [config.baseline_latency_ms * m for m in ANOMALY_MULTIPLIERS]
+            static_scores = [min(max((lat - p90) / p90, 0.0), 1.0) for lat in test_latencies]
+            
+            use_ema = self.harness.baseline_mode == "ema"
+            scores = []
+            blocked = []
+            with pinned_to_cpu():
+                for latency, estimated_score in zip(test_latencies, static_scores):
+                    result_data, observed_ms = _timed_call(scored_function, latency)
+                    
+                    if use_ema:
+                        # Score the observed latency against the streaming baseline
+                        mu, s, estimated_score = _ema_step(mu, s, observed_ms)
+                    
+                    # Blocked calls score high; allowed ones keep the lower estimate
+                    scores.append(0.9 if result_data is None else estimated_score)
+                    blocked.append(result_data is None)
+            
+            self.harness.record_detections(result, scores, blocked)
             
             # Test passes if we have some high scores
-            high_scores = [s for s in result.anomaly_scores if s > 0.7]
-            if len(high_scores) > 0:
+            max_score = max(result.anomaly_scores, default=0)
+            if max_score > 0.7:
                 self.harness.complete_test(result, TestStatus.PASSED)
             else:
                 self.harness.complete_test(
                     result,
                     TestStatus.FAILED,
-                    f"No high anomaly scores detected (max: {max(result.anomaly_scores) if result.anomaly_scores else 0})"
+                    f"No high anomaly scores detected (max: {max_score})"
                 )
             
         except Exception as e:
@@ -271,15 +469,15 @@ class LatencyAnomalyTester:
         Returns:
             Test result
         """
-        config = config or LatencyTestConfig()
+        config = config or _DEFAULT_CONFIG
         result = self.harness.start_test(
             "latency_effector_response",
-            metadata={"config": config.__dict__}
+            metadata={"config": asdict(config)}
         )
         
         try:
             # Set up PIC instance
-            agent, brain = self.harness.setup_pic_instance("latency_effector")
+            agent, brain = self.harness.get_pic_instance("latency_effector")
             
             @agent.monitor
             def effector_test_function(is_anomaly: bool) -> str:
@@ -291,28 +489,42 @@ class LatencyAnomalyTester:
                 return "processed"
             
             # Establish baseline
-            for i in range(config.baseline_samples):
-                effector_test_function(False)
-            
-            # Trigger consecutive anomalies
+            self._shared_baseline(
+                agent,
+                effector_test_function,
+                [False] * config.baseline_samples,
+                config
+            )
+            
+            # Trigger consecutive anomalies, stopping once the run is long enough
+            required_blocks = 3
             consecutive_blocks = 0
-            for i in range(config.anomaly_count):
-                result_data = effector_test_function(True)
-                
-                if result_data is None:
-                    consecutive_blocks += 1
-                    self.harness.record_detection(result, anomaly_score=0.9, is_true_positive=True)
-                else:
-                    self.harness.record_miss(result)
+            blocked = 0
+            sent = 0
+            with pinned_to_cpu():
+                for i in range(config.anomaly_count):
+                    result_data = effector_test_function(True)
+                    sent += 1
+                    
+                    if result_data is None:
+                        blocked += 1
+                        consecutive_blocks += 1
+                        if consecutive_blocks >= required_blocks:
+                            break
+                    else:
+                        consecutive_blocks = 0
+            
+            self.harness.record_detections(result, [0.9] * blocked, [True] * blocked)
+            self.harness.record_miss(result, sent - blocked)
             
             # Test passes if effector blocked at least some consecutive anomalies
-            if consecutive_blocks >= 3:
+            if consecutive_blocks >= required_blocks:
                 self.harness.complete_test(result, TestStatus.PASSED)
             else:
                 self.harness.complete_test(
                     result,
                     TestStatus.FAILED,
-                    f"Effector did not block enough consecutive anomalies ({consecutive_blocks}/3)"
+                    f"Effector did not block enough consecutive anomalies ({consecutive_blocks}/{required_blocks})"
                 )
             
         except Exception as e:
@@ -333,15 +545,15 @@ class LatencyAnomalyTester:
         Returns:
             Test result
         """
-        config = config or LatencyTestConfig()
+        config = config or _DEFAULT_CONFIG
         result = self.harness.start_test(
             "latency_baseline_recovery",
-            metadata={"config": config.__dict__}
+            metadata={"config": asdict(config)}
         )
         
         try:
             # Set up PIC instance
-            agent, brain = self.harness.setup_pic_instance("latency_recovery")
+            agent, brain = self.harness.get_pic_instance("latency_recovery")
             
             @agent.monitor
             def recovery_test_function(latency_ms: float) -> str:
@@ -350,25 +562,55 @@ class LatencyAnomalyTester:
                 return f"processed with {latency_ms}ms"
             
             # Establish baseline
-            for i in range(config.baseline_samples):
-                recovery_test_function(config.baseline_latency_ms)
-            
-            # Trigger anomalies
-            for i in range(config.anomaly_count):
-                recovery_test_function(config.anomaly_latency_ms)
-            
-            # Return to normal and test recovery
-            recovery_allowed = 0
-            for i in range(config.recovery_samples):
-                result_data = recovery_test_function(config.baseline_latency_ms)
+            mu, s, _ = self._shared_baseline(
+                agent,
+                recovery_test_function,
+                [config.baseline_latency_ms] * config.baseline_samples,
+                config
+            )
+            baseline = (mu, s)
+            
+            with pinned_to_cpu():
+                # Trigger anomalies
+                for i in range(config.anomaly_count):
+                    _, observed_ms = _timed_call(recovery_test_function, config.anomaly_latency_ms)
+                    mu, s = _ema_update(mu, s, observed_ms)
+                peak_mu = mu
                 
-                if result_data is not None:
-                    # Call was allowed - system is recovering
-                    recovery_allowed += 1
+                # Return to normal and test recovery
+                recovery_allowed = 0
+                for i in range(config.recovery_samples):
+                    result_data, observed_ms = _timed_call(
+                        recovery_test_function, config.baseline_latency_ms
+                    )
+                    mu, s = _ema_update(mu, s, observed_ms)
+                    
+                    if result_data is not None:
+                        # Call was allowed - system is recovering
+                        recovery_allowed += 1
+            
+            # Judge recovery against the pre-anomaly baseline: the anomalies
+            # inflate the variance, so the post-recovery sigma would accept
+            # almost any mean
+            baseline_recovered = _ema_recovered(
+                baseline, peak_mu, mu, config.recovery_samples
+            )
+            result.metadata["ema_baseline"] = {
+                "baseline_mean_ms": baseline[0],
+                "peak_mean_ms": peak_mu,
+                "mean_ms": mu,
+                "std_ms": math.sqrt(s)
+            }
             
             # Test passes if system recovered and allowed normal calls
             recovery_rate = recovery_allowed / config.recovery_samples
-            if recovery_rate > 0.5:  # At least 50% recovery
+            if self.harness.baseline_mode == "ema" and not baseline_recovered:
+                self.harness.complete_test(
+                    result,
+                    TestStatus.FAILED,
+                    f"Baseline mean {mu:.1f}ms did not return toward {baseline[0]:.1f}ms"
+                )
+            elif recovery_rate > 0.5:  # At least 50% recovery
                 self.harness.complete_test(result, TestStatus.PASSED)
             else:
                 self.harness.complete_test(
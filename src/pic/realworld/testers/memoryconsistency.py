@@ -5,15 +5,34 @@ Tests: high load recovery, noise saturation, corrupted state injection
 """
 
 import time
+import random
 import logging
-from typing import Dict, Any
-from ..harness import TestHarness
+from bisect import bisect_right
+from typing import Dict, Any, Callable, Optional, Sequence
+from ..harness import TestHarness, pinned_to_cpu, precise_sleep
+
+
+# Latency of a normal operation, and samples used to establish it
+BASELINE_TIME = 0.005
+BASELINE_SAMPLES = 30
+
+_NS_PER_SEC = 1_000_000_000
+
+# Seeded so noise schedules are reproducible between runs
+_rng = random.Random(42)
+
+# Minimum recovery rate for each grade above "F", ascending
+_GRADE_THRESHOLDS = (0.70, 0.80, 0.90)
+_GRADES = ("F", "C", "B", "A")
 
 
 class MemoryConsistencyTester:
     """Memory consistency and recovery testing.
     
-    Tests PIC's resilience and recovery capabilities.
+    Tests PIC's resilience and recovery capabilities. All tests drive one
+    monitored operation on a shared PIC instance: the baseline is
+    established once, and each test then runs its stress and measurement
+    phases as schedules of operation durations.
     """
     
     def __init__(self, harness: TestHarness):
@@ -24,6 +43,42 @@ class MemoryConsistencyTester:
         """
         self.harness = harness
         self.logger = logging.getLogger(__name__)
+        self._op: Optional[Callable[[float], Any]] = None
+    
+    def _baselined_op(self) -> Callable[[float], Any]:
+        """Get the monitored operation, establishing its baseline on first use.
+        
+        Returns:
+            Monitored operation taking its duration in seconds
+        """
+        if self._op is None:
+            agent, brain = self.harness.get_pic_instance("memory_consistency_test")
+            
+            @agent.monitor
+            def op(dt):
+                precise_sleep(dt)
+                return "ok"
+            
+            self._run_phase(op, [BASELINE_TIME] * BASELINE_SAMPLES)
+            self._op = op
+        
+        return self._op
+    
+    def _run_phase(self, op: Callable[[float], Any], schedule: Sequence[float]) -> int:
+        """Run one call of op per scheduled duration.
+        
+        Args:
+            op: Monitored operation
+            schedule: Operation durations in seconds
+            
+        Returns:
+            Number of calls PIC allowed
+        """
+        allowed = 0
+        with pinned_to_cpu():
+            for dt in schedule:
+                allowed += op(dt) is not None
+        return allowed
     
     def test_high_load_recovery(self) -> Dict[str, Any]:
         """Test recovery after high load saturation.
@@ -32,50 +87,27 @@ class MemoryConsistencyTester:
         """
         self.logger.info("[MEMORY] Testing high load recovery")
         
-        start_time = time.time()
-        agent, brain = self.harness.setup_pic_instance("high_load_recovery_test")
-        
-        baseline_time = 0.005
-        
-        # Establish baseline
-        for i in range(30):
-            @agent.monitor
-            def baseline_op():
-                time.sleep(baseline_time)
-                return "baseline"
-            baseline_op()
+        start_ns = time.monotonic_ns()
+        op = self._baselined_op()
         
         # High load saturation
         self.logger.info("[MEMORY] Saturating with high load...")
-        for i in range(200):
-            @agent.monitor
-            def high_load():
-                time.sleep(0.050)  # 10x slower
-                return f"load_{i}"
-            high_load()
+        self._run_phase(op, [0.050] * 200)  # 10x slower
         
         # Measure recovery
         self.logger.info("[MEMORY] Measuring recovery...")
-        recovery_start = time.time()
-        recovery_success = []
+        recovery_start_ns = time.monotonic_ns()
+        recovery_ops = 30
+        recovered = self._run_phase(op, [BASELINE_TIME] * recovery_ops)
         
-        for i in range(30):
-            @agent.monitor
-            def recovery_op():
-                time.sleep(baseline_time)
-                return f"recovery_{i}"
-            
-            result = recovery_op()
-            recovery_success.append(result is not None)
-        
-        recovery_time = time.time() - recovery_start
-        recovery_rate = sum(recovery_success) / len(recovery_success)
-        duration = time.time() - start_time
+        recovery_time = (time.monotonic_ns() - recovery_start_ns) / _NS_PER_SEC
+        recovery_rate = recovered / recovery_ops
+        duration = (time.monotonic_ns() - start_ns) / _NS_PER_SEC
         
         return {
             "test_type": "high_load_recovery",
             "load_operations": 200,
-            "recovery_operations": 30,
+            "recovery_operations": recovery_ops,
             "recovery_rate": recovery_rate,
             "recovery_time_seconds": recovery_time,
             "total_duration_seconds": duration,
@@ -89,50 +121,26 @@ class MemoryConsistencyTester:
         """
         self.logger.info("[MEMORY] Testing noise saturation recovery")
         
-        start_time = time.time()
-        agent, brain = self.harness.setup_pic_instance("noise_saturation_test")
-        
-        baseline_time = 0.005
-        
-        # Establish baseline
-        for i in range(30):
-            @agent.monitor
-            def baseline_op():
-                time.sleep(baseline_time)
-                return "baseline"
-            baseline_op()
+        start_ns = time.monotonic_ns()
+        op = self._baselined_op()
         
         # Noise saturation
         self.logger.info("[MEMORY] Saturating with noise...")
-        import random
-        for i in range(300):
-            variance = random.uniform(0.001, 0.020)
-            @agent.monitor
-            def noise_op():
-                time.sleep(variance)
-                return f"noise_{i}"
-            noise_op()
+        variances = [_rng.uniform(0.001, 0.020) for _ in range(300)]
+        self._run_phase(op, variances)
         
         # Measure recovery
         self.logger.info("[MEMORY] Measuring recovery...")
-        recovery_success = []
-        
-        for i in range(30):
-            @agent.monitor
-            def recovery_op():
-                time.sleep(baseline_time)
-                return f"recovery_{i}"
-            
-            result = recovery_op()
-            recovery_success.append(result is not None)
+        recovery_ops = 30
+        recovered = self._run_phase(op, [BASELINE_TIME] * recovery_ops)
         
-        recovery_rate = sum(recovery_success) / len(recovery_success)
-        duration = time.time() - start_time
+        recovery_rate = recovered / recovery_ops
+        duration = (time.monotonic_ns() - start_ns) / _NS_PER_SEC
         
         return {
             "test_type": "noise_saturation_recovery",
             "noise_operations": 300,
-            "recovery_operations": 30,
+            "recovery_operations": recovery_ops,
             "recovery_rate": recovery_rate,
             "total_duration_seconds": duration,
             "passed": recovery_rate >= 0.80
@@ -145,46 +153,23 @@ class MemoryConsistencyTester:
         """
         self.logger.info("[MEMORY] Testing baseline integrity")
         
-        start_time = time.time()
-        agent, brain = self.harness.setup_pic_instance("baseline_integrity_test")
-        
-        baseline_time = 0.005
-        
-        # Establish baseline
-        for i in range(50):
-            @agent.monitor
-            def baseline_op():
-                time.sleep(baseline_time)
-                return "baseline"
-            baseline_op()
+        start_ns = time.monotonic_ns()
+        op = self._baselined_op()
         
         # Stress with varied load
-        for i in range(100):
-            variance = 0.020 if i % 10 == 0 else 0.005
-            @agent.monitor
-            def stress_op():
-                time.sleep(variance)
-                return f"stress_{i}"
-            stress_op()
+        self._run_phase(op, [0.020 if i % 10 == 0 else 0.005 for i in range(100)])
         
         # Test baseline accuracy
-        baseline_test = []
-        for i in range(30):
-            @agent.monitor
-            def baseline_check():
-                time.sleep(baseline_time)
-                return f"check_{i}"
-            
-            result = baseline_check()
-            baseline_test.append(result is not None)
+        baseline_checks = 30
+        intact = self._run_phase(op, [BASELINE_TIME] * baseline_checks)
         
-        integrity_rate = sum(baseline_test) / len(baseline_test)
-        duration = time.time() - start_time
+        integrity_rate = intact / baseline_checks
+        duration = (time.monotonic_ns() - start_ns) / _NS_PER_SEC
         
         return {
             "test_type": "baseline_integrity",
             "stress_operations": 100,
-            "baseline_checks": 30,
+            "baseline_checks": baseline_checks,
             "integrity_rate": integrity_rate,
             "total_duration_seconds": duration,
             "passed": integrity_rate >= 0.90
@@ -197,45 +182,23 @@ class MemoryConsistencyTester:
         """
         self.logger.info("[MEMORY] Testing detection during recovery")
         
-        start_time = time.time()
-        agent, brain = self.harness.setup_pic_instance("detection_recovery_test")
-        
-        baseline_time = 0.005
-        
-        # Establish baseline
-        for i in range(30):
-            @agent.monitor
-            def baseline_op():
-                time.sleep(baseline_time)
-                return "baseline"
-            baseline_op()
+        start_ns = time.monotonic_ns()
+        op = self._baselined_op()
         
         # High load
-        for i in range(100):
-            @agent.monitor
-            def load_op():
-                time.sleep(0.030)
-                return f"load_{i}"
-            load_op()
+        self._run_phase(op, [0.030] * 100)
         
         # Test detection during recovery
-        detected = []
-        for i in range(20):
-            @agent.monitor
-            def anomaly_during_recovery():
-                time.sleep(0.050)  # Clear anomaly
-                return f"anomaly_{i}"
-            
-            result = anomaly_during_recovery()
-            detected.append(result is None)
+        anomaly_tests = 20
+        detected = anomaly_tests - self._run_phase(op, [0.050] * anomaly_tests)  # Clear anomaly
         
-        detection_rate = sum(detected) / len(detected)
-        duration = time.time() - start_time
+        detection_rate = detected / anomaly_tests
+        duration = (time.monotonic_ns() - start_ns) / _NS_PER_SEC
         
         return {
             "test_type": "detection_during_recovery",
             "load_operations": 100,
-            "anomaly_tests": 20,
+            "anomaly_tests": anomaly_tests,
             "detection_rate": detection_rate,
             "total_duration_seconds": duration,
             "passed": True  # Test executed
@@ -258,15 +221,18 @@ class MemoryConsistencyTester:
         
         # Calculate overall metrics
         total_tests = len(results)
-        passed_tests = sum(1 for r in results.values() if r.get("passed", False))
-        
-        # Calculate average recovery rate
-        recovery_rates = [
-            r.get("recovery_rate", r.get("integrity_rate", 0))
-            for r in results.values()
-            if "recovery_rate" in r or "integrity_rate" in r
-        ]
-        avg_recovery = sum(recovery_rates) / len(recovery_rates) if recovery_rates else 0
+        passed_tests = 0
+        
+        # Average recovery rate over tests that report one (single pass)
+        rate_sum = 0.0
+        rate_count = 0
+        for r in results.values():
+            passed_tests += bool(r.get("passed", False))
+            rate = r.get("recovery_rate", r.get("integrity_rate"))
+            if rate is not None:
+                rate_sum += rate
+                rate_count += 1
+        avg_recovery = rate_sum / rate_count if rate_count else 0
         
         return {
             "test_category": "memory_consistency",
@@ -280,11 +246,4 @@ class MemoryConsistencyTester:
     
     def _calculate_resilience_grade(self, recovery_rate: float) -> str:
         """Calculate resilience grade."""
-        if recovery_rate >= 0.90:
-            return "A"
-        elif recovery_rate >= 0.80:
-            return "B"
-        elif recovery_rate >= 0.70:
-            return "C"
-        else:
-            return "F"
+        return _GRADES[bisect_right(_GRADE_THRESHOLDS, recovery_rate)]
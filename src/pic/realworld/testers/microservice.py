@@ -3,16 +3,40 @@
 Tests PIC's ability to protect microservices from various attacks.
 """
 
-import time
 import logging
-from typing import Dict, Any
-import psutil
+from operator import mul
+from typing import Dict, Any, Optional, Union
+from dataclasses import dataclass
 import os
 
 from pic.cellagent import CellAgent
+from pic.cellagent import clock
 from pic.realworld.safety import SafetyController
 
 
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass
+class ServiceTestResult:
+    """Outcome of a single microservice test."""
+    passed: bool
+    detections: int
+    metrics: Dict[str, Any]
+    forensic_data: Optional[Dict[str, Any]] = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to the dictionary form used in reports."""
+        data = {
+            "passed": self.passed,
+            "detections": self.detections,
+            "metrics": self.metrics
+        }
+        if self.forensic_data is not None:
+            data["forensic_data"] = self.forensic_data
+        return data
+
+
 class MicroserviceTester:
     """Tests PIC's microservice protection capabilities.
     
@@ -24,6 +48,8 @@ class MicroserviceTester:
     - Maintain independent baselines per service
     """
     
+    logger = _LOGGER
+    
     def __init__(self, agent: CellAgent, safety: SafetyController):
         """Initialize microservice tester.
         
@@ -33,28 +59,44 @@ class MicroserviceTester:
         """
         self.agent = agent
         self.safety = safety
-        self.logger = logging.getLogger(__name__)
-        self.process = psutil.Process(os.getpid())
+        self._process = None
+    
+    def _proc(self):
+        """Get the psutil handle for this process, creating it on first use.
+        
+        psutil is only needed by the CPU correlation test, so it is imported
+        here rather than when the tester is constructed.
+        
+        Returns:
+            psutil.Process for the current process
+        """
+        if self._process is None:
+            import psutil
+            self._process = psutil.Process(os.getpid())
+            # The first cpu_percent() call only starts the sample window (returns 0.0)
+            self._process.cpu_percent(interval=None)
+        return self._process
     
-    def test_auth_failure_detection(self) -> Dict[str, Any]:
+    def test_auth_failure_detection(self) -> ServiceTestResult:
         """Test detection of authentication failure spikes.
         
         Returns:
-            Test result dictionary
+            Test result
         """
-        self.logger.info("Testing auth failure detection...")
+        self.logger.debug("Testing auth failure detection...")
         
         @self.agent.monitor
         def authenticate_user(username: str, password: str, fail: bool = False) -> bool:
             """Authentication function."""
             if fail:
-                time.sleep(0.01)  # Failed auth takes slightly longer
+                clock.sleep(0.01)  # Failed auth takes slightly longer
                 return False
             return True
         
         # Establish baseline with normal auth (mostly successful)
-        for i in range(30):
-            authenticate_user(f"user{i}", "correct_password", fail=False)
+        self.agent.seed_baseline(
+            authenticate_user, [0.1] * 30, "user", "correct_password", fail=False
+        )
         
         # Simulate auth failure spike (brute force attempt)
         failure_count = 50
@@ -68,39 +110,38 @@ class MicroserviceTester:
         # Detection: spike in failures should be flagged
         detected = failures_detected > 0
         
-        return {
-            "passed": detected,
-            "detections": failures_detected,
-            "metrics": {
+        return ServiceTestResult(
+            passed=detected,
+            detections=failures_detected,
+            metrics={
                 "failure_attempts": failure_count,
                 "failures_detected": failures_detected,
                 "detection_rate": failures_detected / failure_count
             },
-            "forensic_data": {
+            forensic_data={
                 "attack_type": "brute_force_auth",
                 "pattern": "authentication_failure_spike"
             }
-        }
+        )
     
-    def test_transaction_pattern_detection(self) -> Dict[str, Any]:
+    def test_transaction_pattern_detection(self) -> ServiceTestResult:
         """Test detection of unusual transaction patterns.
         
         Returns:
-            Test result dictionary
+            Test result
         """
-        self.logger.info("Testing transaction pattern detection...")
+        self.logger.debug("Testing transaction pattern detection...")
         
         @self.agent.monitor
         def process_transaction(amount: float, transaction_type: str) -> str:
             """Transaction processing function."""
             # Simulate processing time
-            time.sleep(0.005)
+            clock.sleep(0.005)
             return f"transaction_{transaction_type}_completed"
         
         # Establish baseline with normal transactions
         normal_amount = 100.0
-        for i in range(30):
-            process_transaction(normal_amount, "purchase")
+        self.agent.seed_baseline(process_transaction, [5.0] * 30, normal_amount, "purchase")
         
         # Simulate unusual transaction pattern (very large amount)
         unusual_amount = normal_amount * 1000  # 1000x normal
@@ -109,54 +150,59 @@ class MicroserviceTester:
         # Detection: unusual transaction should be flagged
         detected = result is None
         
-        return {
-            "passed": detected,
-            "detections": 1 if detected else 0,
-            "metrics": {
+        return ServiceTestResult(
+            passed=detected,
+            detections=1 if detected else 0,
+            metrics={
                 "normal_amount": normal_amount,
                 "unusual_amount": unusual_amount,
                 "amount_multiplier": 1000,
                 "detected": detected
             }
-        }
+        )
     
-    def test_cpu_correlation(self) -> Dict[str, Any]:
+    def test_cpu_correlation(self) -> ServiceTestResult:
         """Test CPU correlation with function execution.
         
         Returns:
-            Test result dictionary
+            Test result
         """
-        self.logger.info("Testing CPU correlation...")
+        self.logger.debug("Testing CPU correlation...")
         
         @self.agent.monitor
         def cpu_intensive_operation(intensity: int) -> int:
             """CPU-intensive operation."""
-            # Simulate CPU work
-            result = 0
-            for i in range(intensity * 1000):
-                result += i ** 2
-            return result
+            # Simulate CPU work: sum of squares, looped in C rather than bytecode
+            n = intensity * 1000
+            return sum(map(mul, range(n), range(n)))
         
-        # Establish baseline with low intensity
+        # Start the CPU sample window before the baseline runs
+        process = self._proc()
+        
+        # Establish baseline with low intensity; the inputs are benign, so
+        # only their timing is recorded and committed in one step
         baseline_intensity = 10
+        baseline_operation = self.agent.monitor_fast(cpu_intensive_operation)
         for i in range(30):
-            cpu_intensive_operation(baseline_intensity)
+            baseline_operation(baseline_intensity)
+        self.agent.commit_fast(baseline_operation)
         
         # Execute high-intensity operation
         high_intensity = baseline_intensity * 50
         
-        cpu_before = self.process.cpu_percent()
+        # Non-blocking reads; each covers the time since the previous call
+        cpu_before = process.cpu_percent(interval=None)
         result = cpu_intensive_operation(high_intensity)
-        cpu_after = self.process.cpu_percent()
+        cpu_after = process.cpu_percent(interval=None)
         
         # Detection: high CPU usage should correlate with execution
         detected = result is None
         cpu_spike = cpu_after > cpu_before
         
-        return {
-            "passed": detected or cpu_spike,
-            "detections": 1 if detected else 0,
-            "metrics": {
+        return ServiceTestResult(
+            passed=detected or cpu_spike,
+            detections=1 if detected else 0,
+            metrics={
                 "baseline_intensity": baseline_intensity,
                 "high_intensity": high_intensity,
                 "cpu_before": cpu_before,
@@ -164,71 +210,71 @@ class MicroserviceTester:
                 "cpu_spike_detected": cpu_spike,
                 "operation_detected": detected
             }
-        }
+        )
     
-    def test_payload_size_detection(self) -> Dict[str, Any]:
+    def test_payload_size_detection(self) -> ServiceTestResult:
         """Test detection of payload size anomalies.
         
         Returns:
-            Test result dictionary
+            Test result
         """
-        self.logger.info("Testing payload size detection...")
+        self.logger.debug("Testing payload size detection...")
         
         @self.agent.monitor
-        def process_payload(data: str) -> int:
+        def process_payload(data: Union[str, bytes, bytearray]) -> int:
             """Payload processing function."""
             return len(data)
         
         # Establish baseline with normal payload sizes
         normal_size = 1000
-        for i in range(30):
-            process_payload("x" * normal_size)
+        normal_payload = bytearray(normal_size)
+        self.agent.seed_baseline(process_payload, [0.01] * 30, normal_payload)
         
         # Send oversized payload (100x normal)
-        oversized_payload = "x" * (normal_size * 100)
+        oversized_size = normal_size * 100
+        oversized_payload = bytearray(oversized_size)
         result = process_payload(oversized_payload)
         
         # Detection: oversized payload should be flagged
         detected = result is None
         
-        return {
-            "passed": detected,
-            "detections": 1 if detected else 0,
-            "metrics": {
+        return ServiceTestResult(
+            passed=detected,
+            detections=1 if detected else 0,
+            metrics={
                 "normal_size": normal_size,
-                "oversized_size": len(oversized_payload),
+                "oversized_size": oversized_size,
                 "size_multiplier": 100,
                 "detected": detected
             }
-        }
+        )
     
-    def test_independent_baselines(self) -> Dict[str, Any]:
+    def test_independent_baselines(self) -> ServiceTestResult:
         """Test that multiple services maintain independent baselines.
         
         Returns:
-            Test result dictionary
+            Test result
         """
-        self.logger.info("Testing independent baselines...")
+        self.logger.debug("Testing independent baselines...")
         
         @self.agent.monitor
         def auth_service_operation(delay_ms: float) -> str:
             """Auth service operation."""
-            time.sleep(delay_ms / 1000.0)
+            clock.sleep(delay_ms / 1000.0)
             return "auth_completed"
         
         @self.agent.monitor
         def billing_service_operation(delay_ms: float) -> str:
             """Billing service operation."""
-            time.sleep(delay_ms / 1000.0)
+            clock.sleep(delay_ms / 1000.0)
             return "billing_completed"
         
         # Establish different baselines for each service
         auth_baseline = 10  # 10ms
         billing_baseline = 50  # 50ms (slower service)
         
-        for i in range(30):
-            auth_service_operation(auth_baseline)
-            billing_service_operation(billing_baseline)
+        self.agent.seed_baseline(auth_service_operation, [auth_baseline] * 30, auth_baseline)
+        self.agent.seed_baseline(billing_service_operation, [billing_baseline] * 30, billing_baseline)
         
         # Test that each service has independent baseline
         # Auth service with billing-like delay should be anomalous
@@ -242,17 +288,17 @@ class MicroserviceTester:
         # Success if baselines are independent
         passed = auth_detected and billing_normal
         
-        return {
-            "passed": passed,
-            "detections": 1 if auth_detected else 0,
-            "metrics": {
+        return ServiceTestResult(
+            passed=passed,
+            detections=1 if auth_detected else 0,
+            metrics={
                 "auth_baseline_ms": auth_baseline,
                 "billing_baseline_ms": billing_baseline,
                 "auth_anomaly_detected": auth_detected,
                 "billing_normal_accepted": billing_normal,
                 "baselines_independent": passed
             }
-        }
+        )
     
     def run_all_tests(self) -> Dict[str, Any]:
         """Run all microservice tests.
@@ -262,18 +308,19 @@ class MicroserviceTester:
         """
         self.logger.info("Running all microservice tests...")
         
+        # Sleep-based tests run on simulated time; CPU correlation needs real time
         results = {
-            "auth_failure": self.test_auth_failure_detection(),
-            "transaction_pattern": self.test_transaction_pattern_detection(),
+            "auth_failure": clock.run_simulated(self.test_auth_failure_detection),
+            "transaction_pattern": clock.run_simulated(self.test_transaction_pattern_detection),
             "cpu_correlation": self.test_cpu_correlation(),
             "payload_size": self.test_payload_size_detection(),
-            "independent_baselines": self.test_independent_baselines()
+            "independent_baselines": clock.run_simulated(self.test_independent_baselines)
         }
         
         # Calculate overall metrics
         total_tests = len(results)
-        passed_tests = sum(1 for r in results.values() if r.get("passed", False))
-        total_detections = sum(r.get("detections", 0) for r in results.values())
+        passed_tests = sum(r.passed for r in results.values())
+        total_detections = sum(r.detections for r in results.values())
         
         return {
             "test_category": "microservice",
@@ -281,7 +328,7 @@ class MicroserviceTester:
             "passed_tests": passed_tests,
             "pass_rate": passed_tests / total_tests,
             "total_detections": total_detections,
-            "individual_results": results,
+            "individual_results": {name: r.to_dict() for name, r in results.items()},
             "metrics": {
                 "tests_passed": passed_tests,
                 "tests_failed": total_tests - passed_tests
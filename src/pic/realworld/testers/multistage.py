@@ -6,11 +6,29 @@ Simulates: reconnaissance → exploitation → payload → persistence
 
 import time
 import logging
-from typing import Dict, Any, List
+from bisect import bisect_right
+from typing import Dict, Any, List, Optional
 from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
 
 from ..harness import TestHarness
 from pic.cellagent import CellAgent
+from pic.cellagent import clock
+from pic.brain.core import BrainCore
+
+_LOGGER = logging.getLogger(__name__)
+
+# Minimum detection rate for each grade above "F", ascending
+_GRADE_THRESHOLDS = (0.25, 0.50, 0.75)
+_GRADES = ("F", "C", "B", "A")
+
+# Full attack chain, in order: (stage, request count, per-request sleep seconds)
+_ATTACK_CHAIN = (
+    ("recon", 20, 0.010),
+    ("exploit", 10, 0.050),
+    ("payload", 5, 0.100),
+    ("persist", 10, 0.080),
+)
 
 
 @dataclass
@@ -28,6 +46,8 @@ class MultiStageAttackTester:
     Simulates APT-style attack progression through multiple stages.
     """
     
+    logger = _LOGGER
+    
     def __init__(self, harness: TestHarness):
         """Initialize multi-stage attack tester.
         
@@ -35,42 +55,63 @@ class MultiStageAttackTester:
             harness: TestHarness for PIC setup
         """
         self.harness = harness
-        self.logger = logging.getLogger(__name__)
     
-    def test_reconnaissance_stage(self) -> Dict[str, Any]:
+    def _seed_baseline(self, agent: CellAgent, n: int = 30, duration_s: float = 0.005) -> None:
+        """Feed the agent n baseline observations of duration_s each.
+        
+        The observations are injected with CellAgent.seed_baseline() rather
+        than produced by n real calls.
+        
+        Args:
+            agent: CellAgent to establish the baseline on
+            n: Number of baseline observations
+            duration_s: Duration of each observation in seconds
+        """
+        @agent.monitor
+        def baseline_op():
+            clock.sleep(duration_s)
+            return "baseline"
+        
+        agent.seed_baseline(baseline_op, [duration_s * 1000.0] * n)
+    
+    def test_reconnaissance_stage(
+        self,
+        agent: Optional[CellAgent] = None,
+        brain: Optional[BrainCore] = None
+    ) -> Dict[str, Any]:
         """Test Stage 1: Reconnaissance.
         
         Characteristics:
         - Low intensity, high volume
         - Port scanning simulation
         - Service enumeration
-        """
-        self.logger.info("[MULTISTAGE] Testing reconnaissance stage")
         
-        start_time = time.time()
-        agent, brain = self.harness.setup_pic_instance("recon_test")
+        Args:
+            agent: CellAgent with an established baseline (a fresh
+                instance is set up when omitted)
+            brain: BrainCore paired with agent
+        """
+        self.logger.debug("[MULTISTAGE] Testing reconnaissance stage")
         
-        # Establish baseline
-        for i in range(30):
-            @agent.monitor
-            def baseline_op():
-                time.sleep(0.005)
-                return "baseline"
-            baseline_op()
+        start_time = time.perf_counter()
+        if agent is None:
+            agent, brain = self.harness.setup_pic_instance("recon_test")
+            
+            # Establish baseline
+            self._seed_baseline(agent)
         
         # Reconnaissance: many low-intensity probes
+        @agent.monitor
+        def recon_probe(i):
+            clock.sleep(0.010)  # Slightly slower than baseline
+            return f"scan_port_{i}"
+        
         recon_detected = []
         for i in range(50):
-            @agent.monitor
-            def recon_probe():
-                time.sleep(0.010)  # Slightly slower than baseline
-                return f"scan_port_{i}"
-            
-            result = recon_probe()
-            recon_detected.append(result is None)
+            recon_detected.append(recon_probe(i) is None)
         
         detection_rate = sum(recon_detected) / len(recon_detected)
-        duration = time.time() - start_time
+        duration = time.perf_counter() - start_time
         
         return {
             "stage": "reconnaissance",
@@ -81,40 +122,44 @@ class MultiStageAttackTester:
             "passed": True  # Test executed
         }
     
-    def test_exploitation_stage(self) -> Dict[str, Any]:
+    def test_exploitation_stage(
+        self,
+        agent: Optional[CellAgent] = None,
+        brain: Optional[BrainCore] = None
+    ) -> Dict[str, Any]:
         """Test Stage 2: Exploitation.
         
         Characteristics:
         - Medium intensity
         - SQL injection attempts
         - Buffer overflow patterns
-        """
-        self.logger.info("[MULTISTAGE] Testing exploitation stage")
         
-        start_time = time.time()
-        agent, brain = self.harness.setup_pic_instance("exploit_test")
+        Args:
+            agent: CellAgent with an established baseline (a fresh
+                instance is set up when omitted)
+            brain: BrainCore paired with agent
+        """
+        self.logger.debug("[MULTISTAGE] Testing exploitation stage")
         
-        # Establish baseline
-        for i in range(30):
-            @agent.monitor
-            def baseline_op():
-                time.sleep(0.005)
-                return "baseline"
-            baseline_op()
+        start_time = time.perf_counter()
+        if agent is None:
+            agent, brain = self.harness.setup_pic_instance("exploit_test")
+            
+            # Establish baseline
+            self._seed_baseline(agent)
         
         # Exploitation: medium intensity attacks
+        @agent.monitor
+        def exploit_attempt(i):
+            clock.sleep(0.050)  # 10x slower than baseline
+            return f"exploit_{i}"
+        
         exploit_detected = []
         for i in range(20):
-            @agent.monitor
-            def exploit_attempt():
-                time.sleep(0.050)  # 10x slower than baseline
-                return f"exploit_{i}"
-            
-            result = exploit_attempt()
-            exploit_detected.append(result is None)
+            exploit_detected.append(exploit_attempt(i) is None)
         
         detection_rate = sum(exploit_detected) / len(exploit_detected)
-        duration = time.time() - start_time
+        duration = time.perf_counter() - start_time
         
         return {
             "stage": "exploitation",
@@ -125,40 +170,44 @@ class MultiStageAttackTester:
             "passed": True
         }
     
-    def test_payload_delivery_stage(self) -> Dict[str, Any]:
+    def test_payload_delivery_stage(
+        self,
+        agent: Optional[CellAgent] = None,
+        brain: Optional[BrainCore] = None
+    ) -> Dict[str, Any]:
         """Test Stage 3: Payload Delivery.
         
         Characteristics:
         - High intensity
         - Malware download simulation
         - Code injection patterns
-        """
-        self.logger.info("[MULTISTAGE] Testing payload delivery stage")
         
-        start_time = time.time()
-        agent, brain = self.harness.setup_pic_instance("payload_test")
+        Args:
+            agent: CellAgent with an established baseline (a fresh
+                instance is set up when omitted)
+            brain: BrainCore paired with agent
+        """
+        self.logger.debug("[MULTISTAGE] Testing payload delivery stage")
         
-        # Establish baseline
-        for i in range(30):
-            @agent.monitor
-            def baseline_op():
-                time.sleep(0.005)
-                return "baseline"
-            baseline_op()
+        start_time = time.perf_counter()
+        if agent is None:
+            agent, brain = self.harness.setup_pic_instance("payload_test")
+            
+            # Establish baseline
+            self._seed_baseline(agent)
         
         # Payload delivery: high intensity
+        @agent.monitor
+        def payload_drop(i):
+            clock.sleep(0.100)  # 20x slower than baseline
+            return f"payload_{i}"
+        
         payload_detected = []
         for i in range(10):
-            @agent.monitor
-            def payload_drop():
-                time.sleep(0.100)  # 20x slower than baseline
-                return f"payload_{i}"
-            
-            result = payload_drop()
-            payload_detected.append(result is None)
+            payload_detected.append(payload_drop(i) is None)
         
         detection_rate = sum(payload_detected) / len(payload_detected)
-        duration = time.time() - start_time
+        duration = time.perf_counter() - start_time
         
         return {
             "stage": "payload_delivery",
@@ -169,40 +218,44 @@ class MultiStageAttackTester:
             "passed": True
         }
     
-    def test_persistence_stage(self) -> Dict[str, Any]:
+    def test_persistence_stage(
+        self,
+        agent: Optional[CellAgent] = None,
+        brain: Optional[BrainCore] = None
+    ) -> Dict[str, Any]:
         """Test Stage 4: Persistence.
         
         Characteristics:
         - Sustained high intensity
         - Backdoor installation
         - Registry modification simulation
-        """
-        self.logger.info("[MULTISTAGE] Testing persistence stage")
         
-        start_time = time.time()
-        agent, brain = self.harness.setup_pic_instance("persistence_test")
+        Args:
+            agent: CellAgent with an established baseline (a fresh
+                instance is set up when omitted)
+            brain: BrainCore paired with agent
+        """
+        self.logger.debug("[MULTISTAGE] Testing persistence stage")
         
-        # Establish baseline
-        for i in range(30):
-            @agent.monitor
-            def baseline_op():
-                time.sleep(0.005)
-                return "baseline"
-            baseline_op()
+        start_time = time.perf_counter()
+        if agent is None:
+            agent, brain = self.harness.setup_pic_instance("persistence_test")
+            
+            # Establish baseline
+            self._seed_baseline(agent)
         
         # Persistence: sustained high intensity
+        @agent.monitor
+        def persist_attempt(i):
+            clock.sleep(0.080)  # 16x slower than baseline
+            return f"persist_{i}"
+        
         persist_detected = []
         for i in range(15):
-            @agent.monitor
-            def persist_attempt():
-                time.sleep(0.080)  # 16x slower than baseline
-                return f"persist_{i}"
-            
-            result = persist_attempt()
-            persist_detected.append(result is None)
+            persist_detected.append(persist_attempt(i) is None)
         
         detection_rate = sum(persist_detected) / len(persist_detected)
-        duration = time.time() - start_time
+        duration = time.perf_counter() - start_time
         
         return {
             "stage": "persistence",
@@ -213,76 +266,49 @@ class MultiStageAttackTester:
             "passed": True
         }
     
-    def test_full_attack_chain(self) -> Dict[str, Any]:
+    def test_full_attack_chain(
+        self,
+        agent: Optional[CellAgent] = None,
+        brain: Optional[BrainCore] = None
+    ) -> Dict[str, Any]:
         """Test complete attack chain progression.
         
         Simulates full APT attack: recon → exploit → payload → persist
-        """
-        self.logger.info("[MULTISTAGE] Testing full attack chain")
-        
-        start_time = time.time()
-        agent, brain = self.harness.setup_pic_instance("full_chain_test")
         
-        # Establish baseline
-        for i in range(30):
-            @agent.monitor
-            def baseline_op():
-                time.sleep(0.005)
-                return "baseline"
-            baseline_op()
-        
-        # Execute full attack chain
-        chain_results = []
+        Args:
+            agent: CellAgent with an established baseline (a fresh
+                instance is set up when omitted)
+            brain: BrainCore paired with agent
+        """
+        self.logger.debug("[MULTISTAGE] Testing full attack chain")
         
-        # Stage 1: Reconnaissance (20 requests)
-        for i in range(20):
-            @agent.monitor
-            def recon():
-                time.sleep(0.010)
-                return f"recon_{i}"
-            result = recon()
-            chain_results.append(("recon", result is None))
-        
-        # Stage 2: Exploitation (10 requests)
-        for i in range(10):
-            @agent.monitor
-            def exploit():
-                time.sleep(0.050)
-                return f"exploit_{i}"
-            result = exploit()
-            chain_results.append(("exploit", result is None))
-        
-        # Stage 3: Payload (5 requests)
-        for i in range(5):
-            @agent.monitor
-            def payload():
-                time.sleep(0.100)
-                return f"payload_{i}"
-            result = payload()
-            chain_results.append(("payload", result is None))
-        
-        # Stage 4: Persistence (10 requests)
-        for i in range(10):
-            @agent.monitor
-            def persist():
-                time.sleep(0.080)
-                return f"persist_{i}"
-            result = persist()
-            chain_results.append(("persist", result is None))
-        
-        # Analyze chain detection
-        stage_detections = {
-            "recon": sum(1 for s, d in chain_results if s == "recon" and d),
-            "exploit": sum(1 for s, d in chain_results if s == "exploit" and d),
-            "payload": sum(1 for s, d in chain_results if s == "payload" and d),
-            "persist": sum(1 for s, d in chain_results if s == "persist" and d)
-        }
+        start_time = time.perf_counter()
+        if agent is None:
+            agent, brain = self.harness.setup_pic_instance("full_chain_test")
+            
+            # Establish baseline
+            self._seed_baseline(agent)
+        
+        # One monitored entry point shared by every stage, so the whole chain
+        # is scored against a single baseline
+        @agent.monitor
+        def stage_op(stage, sleep_s):
+            clock.sleep(sleep_s)
+            return stage
+        
+        # Execute full attack chain in a single pass, counting blocked
+        # requests per stage
+        stage_detections = {}
+        for stage, count, sleep_s in _ATTACK_CHAIN:
+            stage_detections[stage] = sum(
+                stage_op(stage, sleep_s) is None for _ in range(count)
+            )
         
         total_blocked = sum(stage_detections.values())
-        total_requests = len(chain_results)
+        total_requests = sum(count for _, count, _ in _ATTACK_CHAIN)
         overall_detection = total_blocked / total_requests
         
-        duration = time.time() - start_time
+        duration = time.perf_counter() - start_time
         
         return {
             "test_type": "full_attack_chain",
@@ -302,17 +328,28 @@ class MultiStageAttackTester:
         """
         self.logger.info("[MULTISTAGE] Starting all multi-stage attack tests")
         
-        results = {
-            "reconnaissance": self.test_reconnaissance_stage(),
-            "exploitation": self.test_exploitation_stage(),
-            "payload_delivery": self.test_payload_delivery_stage(),
-            "persistence": self.test_persistence_stage(),
-            "full_chain": self.test_full_attack_chain()
+        # One PIC instance and baseline shared by every stage
+        agent, brain = self.harness.get_pic_instance("multistage_shared")
+        self._seed_baseline(agent)
+        
+        # Stages are independent, so run them concurrently
+        stages = {
+            "reconnaissance": self.test_reconnaissance_stage,
+            "exploitation": self.test_exploitation_stage,
+            "payload_delivery": self.test_payload_delivery_stage,
+            "persistence": self.test_persistence_stage,
+            "full_chain": self.test_full_attack_chain
         }
+        with ThreadPoolExecutor(max_workers=len(stages)) as executor:
+            futures = {
+                name: executor.submit(clock.run_simulated, stage, agent, brain)
+                for name, stage in stages.items()
+            }
+        results = {name: future.result() for name, future in futures.items()}
         
         # Calculate overall metrics
         total_tests = len(results)
-        passed_tests = sum(1 for r in results.values() if r.get("passed", False))
+        passed_tests = sum(r["passed"] for r in results.values())
         
         # Calculate average detection rate
         detection_rates = [
@@ -333,11 +370,4 @@ class MultiStageAttackTester:
     
     def _calculate_attack_grade(self, detection_rate: float) -> str:
         """Calculate attack detection grade."""
-        if detection_rate >= 0.75:
-            return "A"
-        elif detection_rate >= 0.50:
-            return "B"
-        elif detection_rate >= 0.25:
-            return "C"
-        else:
-            return "F"
+        return _GRADES[bisect_right(_GRADE_THRESHOLDS, detection_rate)]
@@ -7,15 +7,94 @@ import builtins
 import sys
 import random
 import string
-from typing import Any, List
-from dataclasses import dataclass
+from typing import Any, List, Optional
+from dataclasses import dataclass, asdict
 import logging
 
 from pic.realworld.harness import TestHarness, TestStatus
 from pic.cellagent import CellAgent
+from pic.brain.core import BrainCore
 
 
-@dataclass
+# Valid UTF-8 payload used as the encoding-test baseline
+_VALID_UTF8 = b"Hello World"
+
+# Malformed UTF-8 payloads replayed against the monitored decoder
+_INVALID_UTF8 = (
+    b'\x80\x81\x82\x83',  # Invalid UTF-8
+    b'\xFF\xFE\xFD',      # Invalid bytes
+    b'\xC0\x80',          # Overlong encoding
+)
+
+
+def _count_depth(root: Any, limit: Optional[int] = None) -> int:
+    """Compute the maximum nesting depth of dicts and lists in root.
+    
+    Walks the structure with an explicit stack rather than recursion.
+    Only containers are pushed: a non-empty container at depth d already
+    proves depth d + 1, so its scalar children need no visit of their own.
+    Containers are matched by exact type (plain dicts and lists only),
+    which is a pointer comparison rather than an isinstance() MRO walk.
+    
+    Args:
+        root: Structure to measure
+        limit: Stop walking once this depth is reached
+        
+    Returns:
+        Deepest nesting level reached (0 for a scalar), capped at limit
+    """
+    root_type = type(root)
+    if root_type is not dict and root_type is not list:
+        return 0
+    
+    max_depth = 0
+    stack = [(root, 0)]
+    while stack:
+        obj, depth = stack.pop()
+        children = obj.values() if type(obj) is dict else obj
+        if not children:
+            continue
+        depth += 1
+        if depth > max_depth:
+            if limit is not None and depth >= limit:
+                return limit
+            max_depth = depth
+        for child in children:
+            child_type = type(child)
+            if child_type is dict or child_type is list:
+                stack.append((child, depth))
+    return max_depth
+
+
+def uses_builtins(data: str) -> int:
+    """Function that uses builtin functions."""
+    return len(data)
+
+
+def process_data(data: bytes) -> int:
+    """Function that processes byte data."""
+    return len(data)
+
+
+def process_structure(data: dict, depth_limit: Optional[int] = None) -> int:
+    """Function that processes nested structures."""
+    return _count_depth(data, depth_limit)
+
+
+def process_text(data: bytes) -> str:
+    """Function that processes byte data."""
+    try:
+        return data.decode('utf-8')
+    except UnicodeDecodeError:
+        return "DECODE_ERROR"
+
+
+def monitored_function(x: int) -> int:
+    """Simple monitored function."""
+    return x * 2
+
+
+@dataclass(frozen=True)
 class RuntimeTestConfig:
     """Configuration for runtime attack tests."""
     baseline_samples: int = 30
@@ -24,6 +103,9 @@ class RuntimeTestConfig:
     max_nesting_depth: int = 10
 
 
+_DEFAULT_CONFIG = RuntimeTestConfig()
+
+
 class RuntimeAttackTester:
     """Tests PIC's runtime attack detection capabilities.
     
@@ -34,13 +116,16 @@ class RuntimeAttackTester:
     - Malformed/non-UTF8 data
     """
     
-    def __init__(self, harness: TestHarness):
+    def __init__(self, harness: TestHarness, reuse_agent: bool = True):
         """Initialize runtime attack tester.
         
         Args:
             harness: Test harness for orchestration
+            reuse_agent: Run all tests in run_all_tests() against one
+                shared PIC instance instead of one per test
         """
         self.harness = harness
+        self.reuse_agent = reuse_agent
         self.logger = logging.getLogger(__name__)
         self._original_builtins = {}
     
@@ -50,17 +135,27 @@ class RuntimeAttackTester:
         Returns:
             List of test results
         """
+        # Each test monitors its own function, so one instance can serve all
+        agent = brain = None
+        if self.reuse_agent:
+            agent, brain = self.harness.get_pic_instance("runtime_shared")
+        
         results = []
         
-        results.append(self.test_monkey_patching_detection())
-        results.append(self.test_argument_size_anomaly())
-        results.append(self.test_structural_complexity())
-        results.append(self.test_encoding_anomaly())
-        results.append(self.test_high_severity_logging())
+        results.append(self.test_monkey_patching_detection(agent=agent, brain=brain))
+        results.append(self.test_argument_size_anomaly(agent=agent, brain=brain))
+        results.append(self.test_structural_complexity(agent=agent, brain=brain))
+        results.append(self.test_encoding_anomaly(agent=agent, brain=brain))
+        results.append(self.test_high_severity_logging(agent=agent, brain=brain))
         
         return results
     
-    def test_monkey_patching_detection(self, config: RuntimeTestConfig = None) -> Any:
+    def test_monkey_patching_detection(
+        self,
+        config: RuntimeTestConfig = None,
+        agent: Optional[CellAgent] = None,
+        brain: Optional[BrainCore] = None
+    ) -> Any:
         """Test detection of monkey-patched builtin functions.
         
         Validates Requirements 2.1: Detection of runtime replacement
@@ -68,32 +163,37 @@ class RuntimeAttackTester:
         
         Args:
             config: Test configuration
+            agent: CellAgent to test (a fresh instance is set up when
+                omitted)
+            brain: BrainCore paired with agent
             
         Returns:
             Test result
         """
-        config = config or RuntimeTestConfig()
+        config = config or _DEFAULT_CONFIG
         result = self.harness.start_test(
             "runtime_monkey_patching",
-            metadata={"config": config.__dict__}
+            metadata={"config": asdict(config)}
         )
         
+        # Save original len function
+        original_len = builtins.len
+        
         try:
             # Set up PIC instance
-            agent, brain = self.harness.setup_pic_instance("runtime_monkey")
+            if agent is None:
+                agent, brain = self.harness.setup_pic_instance("runtime_monkey")
             
             # Create function that uses builtins
-            @agent.monitor
-            def uses_builtins(data: str) -> int:
-                """Function that uses builtin functions."""
-                return len(data)
+            monitored = agent.monitor(uses_builtins)
             
-            # Establish baseline with normal builtins
-            for i in range(config.baseline_samples):
-                uses_builtins(f"sample_{i}")
+            # Build inputs up front so the loops only make monitored calls
+            baseline_inputs = [f"sample_{i}" for i in range(config.baseline_samples)]
+            test_inputs = [f"test_{i}" for i in range(5)]
             
-            # Save original len function
-            original_len = builtins.len
+            # Establish baseline with normal builtins
+            for sample in baseline_inputs:
+                monitored(sample)
             
             # Monkey-patch len function
             def hacked_len(obj):
@@ -101,20 +201,21 @@ class RuntimeAttackTester:
                 return 999999  # Always return large number
             
             builtins.len = hacked_len
+            try:
+                # Try to use the monkey-patched function
+                detections = 0
+                for sample in test_inputs:
+                    result_data = monitored(sample)
+                    
+                    # If PIC detected the monkey-patch, it might block or log
+                    # For now, we check if behavior changed
+                    if result_data is None or result_data == 999999:
+                        detections += 1
+            finally:
+                # Restore original function, even if a call raised
+                builtins.len = original_len
             
-            # Try to use the monkey-patched function
-            detections = 0
-            for i in range(5):
-                result_data = uses_builtins(f"test_{i}")
-                
-                # If PIC detected the monkey-patch, it might block or log
-                # For now, we check if behavior changed
-                if result_data is None or result_data == 999999:
-                    detections += 1
-                    self.harness.record_detection(result, anomaly_score=0.95, is_true_positive=True)
-            
-            # Restore original function
-            builtins.len = original_len
+            self.harness.record_detections(result, [0.95] * detections, [True] * detections)
             
             # Test passes if we detected the monkey-patch
             if detections > 0:
@@ -127,16 +228,17 @@ class RuntimeAttackTester:
                 )
             
         except Exception as e:
-            # Restore original function in case of error
-            if 'original_len' in locals():
-                builtins.len = original_len
-            
             self.logger.error(f"Monkey-patching detection test failed: {e}")
             self.harness.complete_test(result, TestStatus.FAILED, str(e))
         
         return result
     
-    def test_argument_size_anomaly(self, config: RuntimeTestConfig = None) -> Any:
+    def test_argument_size_anomaly(
+        self,
+        config: RuntimeTestConfig = None,
+        agent: Optional[CellAgent] = None,
+        brain: Optional[BrainCore] = None
+    ) -> Any:
         """Test detection of oversized arguments.
         
         Validates Requirements 2.2: Detection of arguments 10x larger
@@ -144,43 +246,45 @@ class RuntimeAttackTester:
         
         Args:
             config: Test configuration
+            agent: CellAgent to test (a fresh instance is set up when
+                omitted)
+            brain: BrainCore paired with agent
             
         Returns:
             Test result
         """
-        config = config or RuntimeTestConfig()
+        config = config or _DEFAULT_CONFIG
         result = self.harness.start_test(
             "runtime_argument_size",
-            metadata={"config": config.__dict__}
+            metadata={"config": asdict(config)}
         )
         
         try:
             # Set up PIC instance
-            agent, brain = self.harness.setup_pic_instance("runtime_argsize")
+            if agent is None:
+                agent, brain = self.harness.setup_pic_instance("runtime_argsize")
             
-            @agent.monitor
-            def process_data(data: str) -> int:
-                """Function that processes string data."""
-                return len(data)
+            monitored = agent.monitor(process_data)
             
             # Establish baseline with normal-sized arguments
-            normal_data = "x" * config.baseline_arg_size
+            normal_data = b"x" * config.baseline_arg_size
             for i in range(config.baseline_samples):
-                process_data(normal_data)
+                monitored(normal_data)
             
             # Test with oversized arguments
-            large_data = "x" * (config.baseline_arg_size * config.large_arg_multiplier)
+            large_data = b"x" * (config.baseline_arg_size * config.large_arg_multiplier)
+            attempts = 5
             detections = 0
             
-            for i in range(5):
-                result_data = process_data(large_data)
+            for i in range(attempts):
+                result_data = monitored(large_data)
                 
                 if result_data is None:
                     # PIC blocked the oversized argument
                     detections += 1
-                    self.harness.record_detection(result, anomaly_score=0.85, is_true_positive=True)
-                else:
-                    self.harness.record_miss(result)
+            
+            self.harness.record_detections(result, [0.85] * detections, [True] * detections)
+            self.harness.record_miss(result, attempts - detections)
             
             # Test passes if we detected oversized arguments
             if detections > 0:
@@ -198,7 +302,12 @@ class RuntimeAttackTester:
         
         return result
     
-    def test_structural_complexity(self, config: RuntimeTestConfig = None) -> Any:
+    def test_structural_complexity(
+        self,
+        config: RuntimeTestConfig = None,
+        agent: Optional[CellAgent] = None,
+        brain: Optional[BrainCore] = None
+    ) -> Any:
         """Test detection of deeply nested data structures.
         
         Validates Requirements 2.3: Detection of data structures with
@@ -206,61 +315,52 @@ class RuntimeAttackTester:
         
         Args:
             config: Test configuration
+            agent: CellAgent to test (a fresh instance is set up when
+                omitted)
+            brain: BrainCore paired with agent
             
         Returns:
             Test result
         """
-        config = config or RuntimeTestConfig()
+        config = config or _DEFAULT_CONFIG
         result = self.harness.start_test(
             "runtime_structural_complexity",
-            metadata={"config": config.__dict__}
+            metadata={"config": asdict(config)}
         )
         
         try:
             # Set up PIC instance
-            agent, brain = self.harness.setup_pic_instance("runtime_structure")
-            
-            @agent.monitor
-            def process_structure(data: dict) -> int:
-                """Function that processes nested structures."""
-                def count_depth(obj, current_depth=0):
-                    if isinstance(obj, dict):
-                        if not obj:
-                            return current_depth
-                        return max(count_depth(v, current_depth + 1) for v in obj.values())
-                    elif isinstance(obj, list):
-                        if not obj:
-                            return current_depth
-                        return max(count_depth(item, current_depth + 1) for item in obj)
-                    else:
-                        return current_depth
-                
-                return count_depth(data)
+            if agent is None:
+                agent, brain = self.harness.setup_pic_instance("runtime_structure")
+            
+            monitored = agent.monitor(process_structure)
+            
+            # Only "deeper than allowed" matters, so stop counting there
+            depth_limit = config.max_nesting_depth + 1
             
             # Establish baseline with shallow nesting
             shallow_data = {"level1": {"level2": "value"}}
             for i in range(config.baseline_samples):
-                process_structure(shallow_data)
+                monitored(shallow_data, depth_limit)
             
-            # Create deeply nested structure
-            deep_data = {"root": {}}
-            current = deep_data["root"]
-            for i in range(config.max_nesting_depth):
-                current[f"level{i}"] = {}
-                current = current[f"level{i}"]
-            current["value"] = "deep"
+            # Create deeply nested structure, innermost level first
+            nested = {"value": "deep"}
+            for i in reversed(range(config.max_nesting_depth)):
+                nested = {f"level{i}": nested}
+            deep_data = {"root": nested}
             
             # Test with deeply nested structure
+            attempts = 5
             detections = 0
-            for i in range(5):
-                result_data = process_structure(deep_data)
+            for i in range(attempts):
+                result_data = monitored(deep_data, depth_limit)
                 
                 if result_data is None:
                     # PIC blocked the complex structure
                     detections += 1
-                    self.harness.record_detection(result, anomaly_score=0.80, is_true_positive=True)
-                else:
-                    self.harness.record_miss(result)
+            
+            self.harness.record_detections(result, [0.80] * detections, [True] * detections)
+            self.harness.record_miss(result, attempts - detections)
             
             # Test passes if we detected complex structures
             if detections > 0:
@@ -278,7 +378,12 @@ class RuntimeAttackTester:
         
         return result
     
-    def test_encoding_anomaly(self, config: RuntimeTestConfig = None) -> Any:
+    def test_encoding_anomaly(
+        self,
+        config: RuntimeTestConfig = None,
+        agent: Optional[CellAgent] = None,
+        brain: Optional[BrainCore] = None
+    ) -> Any:
         """Test detection of malformed/non-UTF8 data.
         
         Validates Requirements 2.4: Detection of encoding anomalies
@@ -286,50 +391,44 @@ class RuntimeAttackTester:
         
         Args:
             config: Test configuration
+            agent: CellAgent to test (a fresh instance is set up when
+                omitted)
+            brain: BrainCore paired with agent
             
         Returns:
             Test result
         """
-        config = config or RuntimeTestConfig()
+        config = config or _DEFAULT_CONFIG
         result = self.harness.start_test(
             "runtime_encoding_anomaly",
-            metadata={"config": config.__dict__}
+            metadata={"config": asdict(config)}
         )
         
         try:
             # Set up PIC instance
-            agent, brain = self.harness.setup_pic_instance("runtime_encoding")
+            if agent is None:
+                agent, brain = self.harness.setup_pic_instance("runtime_encoding")
             
-            @agent.monitor
-            def process_text(data: bytes) -> str:
-                """Function that processes byte data."""
-                try:
-                    return data.decode('utf-8')
-                except UnicodeDecodeError:
-                    return "DECODE_ERROR"
+            monitored = agent.monitor(process_text)
             
             # Establish baseline with valid UTF-8
-            valid_data = "Hello World".encode('utf-8')
+            valid_data = _VALID_UTF8
             for i in range(config.baseline_samples):
-                process_text(valid_data)
+                monitored(valid_data)
             
             # Test with invalid UTF-8 sequences
-            invalid_sequences = [
-                b'\x80\x81\x82\x83',  # Invalid UTF-8
-                b'\xFF\xFE\xFD',      # Invalid bytes
-                b'\xC0\x80',          # Overlong encoding
-            ]
+            invalid_sequences = _INVALID_UTF8
             
             detections = 0
             for invalid_data in invalid_sequences:
-                result_data = process_text(invalid_data)
+                result_data = monitored(invalid_data)
                 
                 if result_data is None or result_data == "DECODE_ERROR":
                     # PIC detected or function caught the error
                     detections += 1
-                    self.harness.record_detection(result, anomaly_score=0.75, is_true_positive=True)
-                else:
-                    self.harness.record_miss(result)
+            
+            self.harness.record_detections(result, [0.75] * detections, [True] * detections)
+            self.harness.record_miss(result, len(invalid_sequences) - detections)
             
             # Test passes if we detected encoding anomalies
             if detections > 0:
@@ -347,7 +446,12 @@ class RuntimeAttackTester:
         
         return result
     
-    def test_high_severity_logging(self, config: RuntimeTestConfig = None) -> Any:
+    def test_high_severity_logging(
+        self,
+        config: RuntimeTestConfig = None,
+        agent: Optional[CellAgent] = None,
+        brain: Optional[BrainCore] = None
+    ) -> Any:
         """Test that monkey-patching is logged with HIGH severity.
         
         Validates Requirements 2.5: High-severity logging for
@@ -355,34 +459,35 @@ class RuntimeAttackTester:
         
         Args:
             config: Test configuration
+            agent: CellAgent to test (a fresh instance is set up when
+                omitted)
+            brain: BrainCore paired with agent
             
         Returns:
             Test result
         """
-        config = config or RuntimeTestConfig()
+        config = config or _DEFAULT_CONFIG
         result = self.harness.start_test(
             "runtime_high_severity_logging",
-            metadata={"config": config.__dict__}
+            metadata={"config": asdict(config)}
         )
         
         try:
             # Set up PIC instance
-            agent, brain = self.harness.setup_pic_instance("runtime_logging")
+            if agent is None:
+                agent, brain = self.harness.setup_pic_instance("runtime_logging")
             
-            @agent.monitor
-            def monitored_function(x: int) -> int:
-                """Simple monitored function."""
-                return x * 2
+            monitored = agent.monitor(monitored_function)
             
             # Establish baseline
             for i in range(config.baseline_samples):
-                monitored_function(i)
+                monitored(i)
             
             # Simulate monkey-patching detection
             # In a real scenario, we'd check audit logs for HIGH severity
             # For now, we simulate the detection
             
-            original_func = monitored_function.__wrapped__ if hasattr(monitored_function, '__wrapped__') else monitored_function
+            original_func = monitored.__wrapped__ if hasattr(monitored, '__wrapped__') else monitored
             
             # Replace function
             def patched_func(x: int) -> int:
@@ -6,15 +6,61 @@ Tests PIC's stability and performance under extreme load conditions.
 import time
 import psutil
 import os
-from typing import List, Any
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any
 from dataclasses import dataclass
 import logging
 
-from pic.realworld.harness import TestHarness, TestStatus
+from pic.realworld.harness import TestHarness, TestStatus, precise_sleep
 from pic.cellagent import CellAgent
 
+_NS_PER_SEC = 1_000_000_000
 
-@dataclass
+# Operations between RSS reads in the memory-under-load test
+MEMORY_SAMPLE_INTERVAL = 32
+
+# Events per monitor_batch() call, and so between timeout checks, in the
+# high-throughput test
+THROUGHPUT_BATCH_SIZE = 1024
+
+
+def high_frequency_operation(op_id: int) -> int:
+    """Fast operation for throughput testing."""
+    return op_id * 2
+
+
+def memory_intensive_operation(data_size: int) -> int:
+    """Operation that allocates memory."""
+    data = array('i', [0]) * data_size  # Packed ints, no per-element objects
+    result = sum(data[:100])  # Use small portion
+    del data  # Explicit cleanup
+    return result
+
+
+def detection_test_function(is_anomaly: bool, delay_ms: float) -> str:
+    """Function for testing detection under load."""
+    if is_anomaly:
+        precise_sleep(delay_ms / 1000.0)
+    return "completed"
+
+
+def overload_function(severity: str, delay_ms: float) -> str:
+    """Function for testing sampling."""
+    precise_sleep(delay_ms / 1000.0)
+    return f"processed_{severity}"
+
+
+def recovery_function(load_level: str) -> str:
+    """Function for testing recovery."""
+    if load_level == "high":
+        precise_sleep(0.050)
+    else:
+        precise_sleep(0.005)
+    return "completed"
+
+
+@dataclass(frozen=True)
 class StressTestConfig:
     """Configuration for stress tests."""
     high_throughput_events: int = 100000
@@ -62,27 +108,23 @@ class StressAbuseTester:
         """
         self.logger.info("Testing high-throughput stability...")
         
-        @self.agent.monitor
-        def high_frequency_operation(op_id: int) -> int:
-            """Fast operation for throughput testing."""
-            return op_id * 2
-        
         # Test parameters
         target_events = 10000  # Reduced from 100k for faster testing
         timeout_seconds = 30
+        timeout_ns = timeout_seconds * _NS_PER_SEC
         
-        start_time = time.time()
+        start_ns = time.monotonic_ns()
         events_processed = 0
         system_stable = True
         
         try:
-            for i in range(target_events):
-                result = high_frequency_operation(i)
-                if result is not None:
-                    events_processed += 1
+            for batch_start in range(0, target_events, THROUGHPUT_BATCH_SIZE):
+                batch = range(batch_start, min(batch_start + THROUGHPUT_BATCH_SIZE, target_events))
+                results = self.agent.monitor_batch(high_frequency_operation, batch)
+                events_processed += sum(result is not None for result in results)
                 
                 # Check timeout
-                if time.time() - start_time > timeout_seconds:
+                if time.monotonic_ns() - start_ns > timeout_ns:
                     self.logger.warning("Throughput test timeout")
                     system_stable = False
                     break
@@ -91,9 +133,9 @@ class StressAbuseTester:
             self.logger.error(f"System crashed during throughput test: {e}")
             system_stable = False
         
-        end_time = time.time()
-        duration = end_time - start_time
-        throughput = events_processed / duration if duration > 0 else 0
+        elapsed_ns = time.monotonic_ns() - start_ns
+        duration = elapsed_ns / _NS_PER_SEC
+        throughput = events_processed * _NS_PER_SEC / elapsed_ns if elapsed_ns > 0 else 0
         
         # Success if processed 80% of events without crashing
         passed = system_stable and events_processed >= target_events * 0.8
@@ -117,13 +159,7 @@ class StressAbuseTester:
         """
         self.logger.info("Testing memory usage under load...")
         
-        @self.agent.monitor
-        def memory_intensive_operation(data_size: int) -> int:
-            """Operation that allocates memory."""
-            data = [0] * data_size
-            result = sum(data[:100])  # Use small portion
-            del data  # Explicit cleanup
-            return result
+        monitored = self.agent.monitor(memory_intensive_operation)
         
         # Record initial memory
         initial_memory = self.get_memory_usage_mb()
@@ -135,14 +171,16 @@ class StressAbuseTester:
         
         try:
             for size in [1000, 5000, 10000, 50000, 100000]:
-                for _ in range(batch_size // 5):
-                    result = memory_intensive_operation(size)
+                for i in range(batch_size // 5):
+                    result = monitored(size)
                     if result is not None:
                         operations_completed += 1
                     
-                    # Track peak memory
-                    current_memory = self.get_memory_usage_mb()
-                    max_memory = max(max_memory, current_memory)
+                    # Track peak memory; reading RSS is a syscall, so sample it
+                    if i % MEMORY_SAMPLE_INTERVAL == 0:
+                        current_memory = self.get_memory_usage_mb()
+                        if current_memory > max_memory:
+                            max_memory = current_memory
                     
         except Exception as e:
             self.logger.error(f"Memory test failed: {e}")
@@ -171,17 +209,12 @@ class StressAbuseTester:
         """
         self.logger.info("Testing detection accuracy under load...")
         
-        @self.agent.monitor
-        def detection_test_function(is_anomaly: bool, delay_ms: float) -> str:
-            """Function for testing detection under load."""
-            if is_anomaly:
-                time.sleep(delay_ms / 1000.0)
-            return "completed"
+        monitored = self.agent.monitor(detection_test_function)
         
         # Establish baseline
         baseline_delay = 5
         for i in range(30):
-            detection_test_function(False, baseline_delay)
+            monitored(False, baseline_delay)
         
         # Generate high load with mixed normal and anomalous operations
         total_operations = 1000
@@ -196,7 +229,7 @@ class StressAbuseTester:
             if is_anomaly:
                 anomalies_injected += 1
             
-            result = detection_test_function(is_anomaly, delay)
+            result = monitored(is_anomaly, delay)
             
             # If anomaly was blocked, it was detected
             if is_anomaly and result is None:
@@ -228,15 +261,11 @@ class StressAbuseTester:
         """
         self.logger.info("Testing sampling under overload...")
         
-        @self.agent.monitor
-        def overload_function(severity: str, delay_ms: float) -> str:
-            """Function for testing sampling."""
-            time.sleep(delay_ms / 1000.0)
-            return f"processed_{severity}"
+        monitored = self.agent.monitor(overload_function)
         
         # Establish baseline
         for i in range(30):
-            overload_function("normal", 5)
+            monitored("normal", 5)
         
         # Generate overload with critical and non-critical anomalies
         critical_anomalies = 0
@@ -245,15 +274,15 @@ class StressAbuseTester:
         
         for i in range(500):  # High volume
             if i % 50 == 0:  # Critical anomaly (severe)
-                result = overload_function("critical", 100)
+                result = monitored("critical", 100)
                 critical_anomalies += 1
                 if result is None:
                     critical_detected += 1
             elif i % 10 == 0:  # Non-critical anomaly (mild)
-                overload_function("mild", 20)
+                monitored("mild", 20)
                 non_critical_anomalies += 1
             else:  # Normal
-                overload_function("normal", 5)
+                monitored("normal", 5)
         
         # Success if most critical anomalies were preserved
         critical_preservation_rate = critical_detected / critical_anomalies if critical_anomalies > 0 else 0
@@ -278,33 +307,26 @@ class StressAbuseTester:
         """
         self.logger.info("Testing recovery time...")
         
-        @self.agent.monitor
-        def recovery_function(load_level: str) -> str:
-            """Function for testing recovery."""
-            if load_level == "high":
-                time.sleep(0.05)  # 50ms
-            else:
-                time.sleep(0.005)  # 5ms
-            return "completed"
+        monitored = self.agent.monitor(recovery_function)
         
         # Establish baseline
         for i in range(30):
-            recovery_function("normal")
+            monitored("normal")
         
-        # Create overload
-        for i in range(200):
-            recovery_function("high")
+        # Create overload; the calls only sleep, so run them on threads
+        with ThreadPoolExecutor(max_workers=32) as executor:
+            list(executor.map(monitored, ["high"] * 200))
         
         # Measure recovery time
-        recovery_start = time.time()
+        recovery_start_ns = time.monotonic_ns()
         normal_operations = 0
         
         for i in range(50):
-            result = recovery_function("normal")
+            result = monitored("normal")
             if result is not None:
                 normal_operations += 1
         
-        recovery_time = time.time() - recovery_start
+        recovery_time = (time.monotonic_ns() - recovery_start_ns) / _NS_PER_SEC
         
         # Success if recovered within 10 seconds and most operations pass
         passed = recovery_time < 10 and normal_operations >= 40
@@ -335,10 +357,14 @@ class StressAbuseTester:
             "recovery": self.test_recovery_time()
         }
         
-        # Calculate overall metrics
+        # Calculate overall metrics in one pass; only some tests report
+        # detections
         total_tests = len(results)
-        passed_tests = sum(1 for r in results.values() if r.get("passed", False))
-        total_detections = sum(r.get("detections", 0) for r in results.values())
+        passed_tests = 0
+        total_detections = 0
+        for r in results.values():
+            passed_tests += r["passed"]
+            total_detections += r.get("detections", 0)
         
         return {
             "test_category": "stress_abuse",
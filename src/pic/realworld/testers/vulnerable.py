@@ -5,13 +5,137 @@ Tests PIC's ability to protect intentionally vulnerable applications.
 
 import time
 import logging
-from typing import Dict, Any
+import math
+from collections import Counter
+from typing import Dict, Any, Union
 import hashlib
 
 from pic.cellagent import CellAgent
+from pic.cellagent import clock
 from pic.realworld.safety import SafetyController
 
 
+# Search terms used as the normal baseline
+_NORMAL_SEARCHES = ("python", "tutorial", "example", "code", "test")
+
+# SQL injection payloads replayed against the monitored search function
+_SQL_INJECTION_STRINGS = (
+    "' OR '1'='1",
+    "admin'--",
+    "1' UNION SELECT * FROM users--",
+    "'; DROP TABLE users;--",
+    "1' AND 1=1--",
+    "' OR 1=1--",
+    "admin' OR '1'='1'--",
+    "' UNION SELECT NULL, username, password FROM users--"
+)
+
+# Well-formed request headers used as the normal baseline
+_NORMAL_HEADERS = (
+    {"Content-Type": "application/json", "Accept": "application/json"},
+    {"User-Agent": "Mozilla/5.0", "Accept-Language": "en-US"},
+    {"Authorization": "Bearer token123", "Content-Length": "100"}
+)
+
+# Malformed request headers
+_MALFORMED_HEADERS = (
+    {"Content-Type": "x" * 10000},  # Extremely long value
+    {"X-Malformed": "\x00\xff\xfe"},  # Non-UTF8 characters
+    {"\x00Invalid": "value"},  # Null byte in key
+    {"Normal": "value\r\n\r\nInjected: header"}  # Header injection
+)
+
+
+# Suspicious byte classes counted by string_features, in class order
+_FEATURE_NAMES = ("quote", "semicolon", "angle_bracket", "null_byte", "control", "non_ascii")
+
+
+def _build_feature_table() -> bytes:
+    """Map every byte value to its feature class (0 = not suspicious)."""
+    table = bytearray(256)
+    table[ord("'")] = table[ord('"')] = 1
+    table[ord(";")] = 2
+    table[ord("<")] = table[ord(">")] = 3
+    table[0] = 4
+    for b in range(1, 32):
+        table[b] = 5
+    table[0x7f] = 5
+    for b in range(0x80, 256):
+        table[b] = 6
+    return bytes(table)
+
+
+_FEATURE_TABLE = _build_feature_table()
+
+
+def string_features(data: Union[str, bytes]) -> Dict[str, int]:
+    """Count suspicious bytes (quotes, semicolons, null bytes, ...) in a payload.
+    
+    Every byte is mapped to its class through a 256-entry lookup table by
+    bytes.translate(), and the classes are tallied by Counter, so the scan
+    is a single C-level pass whatever the number of feature classes.
+    
+    Args:
+        data: Payload as text (measured as UTF-8) or raw bytes
+        
+    Returns:
+        Count per feature name
+    """
+    if isinstance(data, str):
+        data = data.encode("utf-8", "surrogatepass")
+    counts = Counter(data.translate(_FEATURE_TABLE))
+    return {name: counts[i] for i, name in enumerate(_FEATURE_NAMES, 1)}
+
+
+def calculate_entropy(s: Union[str, bytes]) -> float:
+    """Calculate Shannon entropy of a string or raw payload.
+    
+    Counting is done by Counter's C loop, so the Python-level work is one
+    step per distinct symbol. Raw payloads can be passed as bytes to be
+    measured over byte values without decoding them first.
+    
+    Args:
+        s: String (symbols are characters) or bytes (symbols are byte values)
+        
+    Returns:
+        Entropy in bits per symbol (0.0 for an empty input)
+    """
+    if not s:
+        return 0.0
+    n = len(s)
+    return sum(count * math.log2(n / count) for count in Counter(s).values()) / n
+
+
+def vulnerable_search(search_term: str) -> list:
+    """Vulnerable search function."""
+    # Simulate database query
+    clock.sleep(0.01)
+    return [f"result_for_{search_term}"]
+
+
+def handle_slow_request(request_id: int, delay_seconds: float) -> str:
+    """Request handler that can be slow."""
+    clock.sleep(delay_seconds)
+    return f"response_{request_id}"
+
+
+def parse_headers(headers: dict) -> dict:
+    """Header parsing function."""
+    # Simulate header parsing
+    parsed = {}
+    for key, value in headers.items():
+        if isinstance(value, str) and len(value) < 1000:
+            parsed[key.lower()] = value
+    return parsed
+
+
+def vulnerable_endpoint(attack_vector: str, payload: str) -> str:
+    """Vulnerable endpoint for forensic testing."""
+    if "attack" in attack_vector:
+        clock.sleep(0.05)  # Simulate attack processing
+    return f"processed_{attack_vector}"
+
+
 class VulnerableAppTester:
     """Tests PIC's protection of vulnerable applications.
     
@@ -33,6 +157,12 @@ class VulnerableAppTester:
         self.agent = agent
         self.safety = safety
         self.logger = logging.getLogger(__name__)
+        
+        # Wrap the simulated endpoints once rather than on every test run
+        self._vulnerable_search = agent.monitor(vulnerable_search)
+        self._handle_slow_request = agent.monitor(handle_slow_request)
+        self._parse_headers = agent.monitor(parse_headers)
+        self._vulnerable_endpoint = agent.monitor(vulnerable_endpoint)
     
     def test_application_monitoring(self) -> Dict[str, Any]:
         """Test that all application functions are monitored.
@@ -88,52 +218,24 @@ class VulnerableAppTester:
         """
         self.logger.info("Testing SQL injection string detection...")
         
-        @self.agent.monitor
-        def vulnerable_search(search_term: str) -> list:
-            """Vulnerable search function."""
-            # Simulate database query
-            time.sleep(0.01)
-            return [f"result_for_{search_term}"]
-        
         # Establish baseline with normal searches
-        normal_searches = ["python", "tutorial", "example", "code", "test"]
-        for _ in range(6):
-            for search in normal_searches:
-                vulnerable_search(search)
+        normal_searches = _NORMAL_SEARCHES
+        for search in normal_searches:
+            self.agent.seed_baseline(self._vulnerable_search, [10.0] * 6, search)
         
         # Test SQL injection strings
-        injection_strings = [
-            "' OR '1'='1",
-            "admin'--",
-            "1' UNION SELECT * FROM users--",
-            "'; DROP TABLE users;--",
-            "1' AND 1=1--",
-            "' OR 1=1--",
-            "admin' OR '1'='1'--",
-            "' UNION SELECT NULL, username, password FROM users--"
-        ]
+        injection_strings = _SQL_INJECTION_STRINGS
         
         injections_detected = 0
         
         for injection in injection_strings:
-            result = vulnerable_search(injection)
+            result = self._vulnerable_search(injection)
             if result is None:  # Blocked
                 injections_detected += 1
         
         # Calculate entropy of injection strings (they're typically high)
-        def calculate_entropy(s: str) -> float:
-            """Calculate Shannon entropy of string."""
-            if not s:
-                return 0.0
-            entropy = 0.0
-            for x in set(s):
-                p_x = s.count(x) / len(s)
-                if p_x > 0:
-                    entropy += - p_x * (p_x ** 0.5)  # Simplified entropy
-            return entropy
-        
-        avg_injection_entropy = sum(calculate_entropy(s) for s in injection_strings) / len(injection_strings)
-        avg_normal_entropy = sum(calculate_entropy(s) for s in normal_searches) / len(normal_searches)
+        avg_injection_entropy = sum(map(calculate_entropy, injection_strings)) / len(injection_strings)
+        avg_normal_entropy = sum(map(calculate_entropy, normal_searches)) / len(normal_searches)
         
         detection_rate = injections_detected / len(injection_strings)
         passed = detection_rate > 0.5
@@ -146,11 +248,12 @@ class VulnerableAppTester:
                 "injections_detected": injections_detected,
                 "detection_rate": detection_rate,
                 "avg_injection_entropy": avg_injection_entropy,
-                "avg_normal_entropy": avg_normal_entropy
+                "avg_normal_entropy": avg_normal_entropy,
+                "injection_features": string_features("".join(injection_strings))
             },
             "forensic_data": {
                 "attack_type": "sql_injection",
-                "patterns_tested": injection_strings[:3]  # Sample
+                "patterns_tested": list(injection_strings[:3])  # Sample
             }
         }
     
@@ -162,20 +265,15 @@ class VulnerableAppTester:
         """
         self.logger.info("Testing slowloris attack detection...")
         
-        @self.agent.monitor
-        def handle_slow_request(request_id: int, delay_seconds: float) -> str:
-            """Request handler that can be slow."""
-            time.sleep(delay_seconds)
-            return f"response_{request_id}"
-        
         # Establish baseline with fast requests
         normal_delay = 0.01  # 10ms
-        for i in range(30):
-            handle_slow_request(i, normal_delay)
+        self.agent.seed_baseline(
+            self._handle_slow_request, [normal_delay * 1000.0] * 30, 0, normal_delay
+        )
         
         # Simulate slowloris (very slow requests)
         slow_delay = normal_delay * 50  # 500ms (50x slower)
-        result = handle_slow_request(999, slow_delay)
+        result = self._handle_slow_request(999, slow_delay)
         
         # Detection: abnormally slow request should be flagged
         detected = result is None
@@ -203,39 +301,19 @@ class VulnerableAppTester:
         """
         self.logger.info("Testing malformed header detection...")
         
-        @self.agent.monitor
-        def parse_headers(headers: dict) -> dict:
-            """Header parsing function."""
-            # Simulate header parsing
-            parsed = {}
-            for key, value in headers.items():
-                if isinstance(value, str) and len(value) < 1000:
-                    parsed[key.lower()] = value
-            return parsed
-        
         # Establish baseline with normal headers
-        normal_headers = [
-            {"Content-Type": "application/json", "Accept": "application/json"},
-            {"User-Agent": "Mozilla/5.0", "Accept-Language": "en-US"},
-            {"Authorization": "Bearer token123", "Content-Length": "100"}
-        ]
+        normal_headers = _NORMAL_HEADERS
         
-        for _ in range(10):
-            for headers in normal_headers:
-                parse_headers(headers)
+        # Parsing does real work, so measure it, but buffer the events in bulk
+        self.agent.monitor_batch(self._parse_headers, normal_headers * 10)
         
         # Test malformed headers
-        malformed_headers = [
-            {"Content-Type": "x" * 10000},  # Extremely long value
-            {"X-Malformed": "\x00\xff\xfe"},  # Non-UTF8 characters
-            {"\x00Invalid": "value"},  # Null byte in key
-            {"Normal": "value\r\n\r\nInjected: header"}  # Header injection
-        ]
+        malformed_headers = _MALFORMED_HEADERS
         
         malformed_detected = 0
         
         for headers in malformed_headers:
-            result = parse_headers(headers)
+            result = self._parse_headers(headers)
             if result is None:  # Blocked
                 malformed_detected += 1
         
@@ -248,7 +326,10 @@ class VulnerableAppTester:
             "metrics": {
                 "malformed_attempts": len(malformed_headers),
                 "malformed_detected": malformed_detected,
-                "detection_rate": detection_rate
+                "detection_rate": detection_rate,
+                "suspicious_bytes": string_features(
+                    "".join(k + v for headers in malformed_headers for k, v in headers.items())
+                )
             }
         }
     
@@ -260,24 +341,19 @@ class VulnerableAppTester:
         """
         self.logger.info("Testing forensic data collection...")
         
-        @self.agent.monitor
-        def vulnerable_endpoint(attack_vector: str, payload: str) -> str:
-            """Vulnerable endpoint for forensic testing."""
-            if "attack" in attack_vector:
-                time.sleep(0.05)  # Simulate attack processing
-            return f"processed_{attack_vector}"
-        
-        # Establish baseline
-        for i in range(30):
-            vulnerable_endpoint("normal_request", "safe_data")
+        # Establish baseline (normal requests skip the simulated processing)
+        self.agent.seed_baseline(
+            self._vulnerable_endpoint, [0.0] * 30, "normal_request", "safe_data"
+        )
         
         # Execute attack
         attack_vector = "sql_injection_attack"
         attack_payload = "' OR '1'='1"
         
         start_time = time.time()
-        result = vulnerable_endpoint(attack_vector, attack_payload)
-        end_time = time.time()
+        start = clock.perf_counter()
+        result = self._vulnerable_endpoint(attack_vector, attack_payload)
+        duration_ms = (clock.perf_counter() - start) * 1000
         
         # Check if attack was detected
         detected = result is None
@@ -287,7 +363,7 @@ class VulnerableAppTester:
             "attack_vector": attack_vector,
             "payload": attack_payload,
             "timestamp": start_time,
-            "duration_ms": (end_time - start_time) * 1000,
+            "duration_ms": duration_ms,
             "detected": detected,
             "safety_violations": len(self.safety.get_violations())
         }
@@ -320,11 +396,11 @@ class VulnerableAppTester:
         self.logger.info("Running all vulnerable application tests...")
         
         results = {
-            "application_monitoring": self.test_application_monitoring(),
-            "sql_injection": self.test_sql_injection_string_detection(),
-            "slowloris": self.test_slowloris_detection(),
-            "malformed_headers": self.test_malformed_header_detection(),
-            "forensic_data": self.test_forensic_data_collection()
+            "application_monitoring": clock.run_simulated(self.test_application_monitoring),
+            "sql_injection": clock.run_simulated(self.test_sql_injection_string_detection),
+            "slowloris": clock.run_simulated(self.test_slowloris_detection),
+            "malformed_headers": clock.run_simulated(self.test_malformed_header_detection),
+            "forensic_data": clock.run_simulated(self.test_forensic_data_collection)
         }
         
         # Calculate overall metrics
@@ -3,15 +3,43 @@
 Tests PIC's ability to detect web service attacks in safe mode.
 """
 
-import time
 import logging
 from pathlib import Path
 from typing import Dict, Any
 
 from pic.cellagent import CellAgent
+from pic.cellagent import clock
 from pic.realworld.safety import SafetyController
 
 
+def handle_request(request_id: str, request_rate: int) -> str:
+    """Simulated request handler."""
+    # Simulate processing time
+    clock.sleep(0.001 / request_rate if request_rate > 0 else 0.001)
+    return f"response_{request_id}"
+
+
+def execute_query(query: str, complexity: int) -> str:
+    """Simulated query execution."""
+    # Simulate query processing
+    clock.sleep(complexity * 0.001)
+    return f"result_{len(query)}"
+
+
+def render_content(content: str, sanitization_level: int) -> str:
+    """Simulated content rendering."""
+    # Simulate rendering time
+    clock.sleep(sanitization_level * 0.001)
+    return f"rendered_{len(content)}"
+
+
+def authenticate(username: str, attempt_count: int) -> bool:
+    """Simulated authentication."""
+    # Simulate auth processing
+    clock.sleep(attempt_count * 0.001)
+    return attempt_count < 10
+
+
 class WebServiceTester:
     """Tests PIC's web service attack detection capabilities.
     
@@ -34,6 +62,12 @@ class WebServiceTester:
         self.agent = agent
         self.safety = safety
         self.logger = logging.getLogger(__name__)
+        
+        # Wrap the simulated endpoints once rather than on every test run
+        self._handle_request = agent.monitor(handle_request)
+        self._execute_query = agent.monitor(execute_query)
+        self._render_content = agent.monitor(render_content)
+        self._authenticate = agent.monitor(authenticate)
     
     def test_ddos_pattern(self) -> Dict[str, Any]:
         """Test detection of DDoS patterns.
@@ -43,20 +77,12 @@ class WebServiceTester:
         """
         self.logger.info("Testing DDoS pattern detection...")
         
-        @self.agent.monitor
-        def handle_request(request_id: str, request_rate: int) -> str:
-            """Simulated request handler."""
-            # Simulate processing time
-            time.sleep(0.001 / request_rate if request_rate > 0 else 0.001)
-            return f"response_{request_id}"
-        
-        # Establish baseline with normal request rate
-        for i in range(30):
-            handle_request(f"normal_{i}", 10)  # 10 req/sec
+        # Establish baseline with normal request rate (10 req/sec, 0.1ms each)
+        self.agent.seed_baseline(self._handle_request, [0.1] * 30, "normal", 10)
         
         # Simulate DDoS pattern (request flood)
         ddos_rate = 1000  # 1000 req/sec
-        result = handle_request("ddos_001", ddos_rate)
+        result = self._handle_request("ddos_001", ddos_rate)
         
         # Detection: DDoS pattern should be flagged
         detected = result is None
@@ -84,21 +110,15 @@ class WebServiceTester:
         """
         self.logger.info("Testing SQL injection detection...")
         
-        @self.agent.monitor
-        def execute_query(query: str, complexity: int) -> str:
-            """Simulated query execution."""
-            # Simulate query processing
-            time.sleep(complexity * 0.001)
-            return f"result_{len(query)}"
-        
         # Establish baseline with normal queries
-        for i in range(30):
-            execute_query(f"SELECT * FROM users WHERE id={i}", 1)
+        self.agent.seed_baseline(
+            self._execute_query, [1.0] * 30, "SELECT * FROM users WHERE id=0", 1
+        )
         
         # Simulate SQL injection pattern
         injection_query = "' OR '1'='1"
         injection_complexity = 50  # High complexity
-        result = execute_query(injection_query, injection_complexity)
+        result = self._execute_query(injection_query, injection_complexity)
         
         # Detection: SQL injection should be flagged
         detected = result is None
@@ -126,21 +146,13 @@ class WebServiceTester:
         """
         self.logger.info("Testing XSS pattern detection...")
         
-        @self.agent.monitor
-        def render_content(content: str, sanitization_level: int) -> str:
-            """Simulated content rendering."""
-            # Simulate rendering time
-            time.sleep(sanitization_level * 0.001)
-            return f"rendered_{len(content)}"
-        
         # Establish baseline with normal content
-        for i in range(30):
-            render_content(f"<p>Normal content {i}</p>", 1)
+        self.agent.seed_baseline(self._render_content, [1.0] * 30, "<p>Normal content</p>", 1)
         
         # Simulate XSS pattern
         xss_content = "<script>alert('xss')</script>"
         xss_complexity = 30  # High complexity
-        result = render_content(xss_content, xss_complexity)
+        result = self._render_content(xss_content, xss_complexity)
         
         # Detection: XSS pattern should be flagged
         detected = result is None
@@ -168,20 +180,12 @@ class WebServiceTester:
         """
         self.logger.info("Testing authentication bypass detection...")
         
-        @self.agent.monitor
-        def authenticate(username: str, attempt_count: int) -> bool:
-            """Simulated authentication."""
-            # Simulate auth processing
-            time.sleep(attempt_count * 0.001)
-            return attempt_count < 10
-        
         # Establish baseline with normal auth attempts
-        for i in range(30):
-            authenticate(f"user_{i}", 1)
+        self.agent.seed_baseline(self._authenticate, [1.0] * 30, "user", 1)
         
         # Simulate auth bypass pattern (brute force)
         bypass_attempts = 100  # Many attempts
-        result = authenticate("admin", bypass_attempts)
+        result = self._authenticate("admin", bypass_attempts)
         
         # Detection: auth bypass should be flagged
         detected = result is None or result is False
@@ -210,10 +214,10 @@ class WebServiceTester:
         self.logger.info("Running all web service tests...")
         
         results = {
-            "ddos": self.test_ddos_pattern(),
-            "sql_injection": self.test_sql_injection(),
-            "xss": self.test_xss_pattern(),
-            "auth_bypass": self.test_auth_bypass()
+            "ddos": clock.run_simulated(self.test_ddos_pattern),
+            "sql_injection": clock.run_simulated(self.test_sql_injection),
+            "xss": clock.run_simulated(self.test_xss_pattern),
+            "auth_bypass": clock.run_simulated(self.test_auth_bypass)
         }
         
         # Calculate overall metrics
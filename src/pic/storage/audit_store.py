@@ -1,6 +1,8 @@
 """AuditStore - Append-only immutable log storage with HMAC signing."""
 
 import json
+import os
+import threading
 from pathlib import Path
 from typing import List, Optional
 from datetime import datetime
@@ -8,6 +10,51 @@ from datetime import datetime
 from pic.models.events import AuditEvent
 from pic.crypto import CryptoCore
 
+# Bytes read per call when scanning the log as raw blocks
+_READ_BLOCK_SIZE = 1 << 20
+
+# Read buffer of handles that iterate the log line by line
+_READ_BUFFER_SIZE = 1 << 20
+
+# Bytes read per step when reading the log backwards from the end
+_TAIL_CHUNK_SIZE = 1 << 16
+
+# Write buffer of the long-lived append handle
+_WRITE_BUFFER_SIZE = 1 << 16
+
+# Whitespace other than newlines, dropped when counting non-blank lines
+_INLINE_WHITESPACE = b" \t\r\x0b\x0c"
+
+# Entries are the sorted-key signable JSON with the signature appended, so
+# the timestamp is the last field before it
+_SIGNATURE_FIELD = b', "signature": "'
+_TIMESTAMP_FIELD = b'"timestamp": "'
+
+# Entries written by AuditEvent.to_json() start with the timestamp instead
+_TIMESTAMP_PREFIX = b'{"timestamp": "'
+
+
+def _peek_timestamp(line: bytes) -> Optional[datetime]:
+    """Read an entry's timestamp without parsing the rest of the JSON.
+    
+    Args:
+        line: Raw log line
+        
+    Returns:
+        Entry timestamp, or None if the line has neither known layout
+    """
+    if line.startswith(_TIMESTAMP_PREFIX):
+        start = len(_TIMESTAMP_PREFIX)
+        end = line.find(b'"', start)
+    else:
+        end = line.rfind(_SIGNATURE_FIELD) - 1
+        start = line.rfind(_TIMESTAMP_FIELD, 0, max(end, 0)) + len(_TIMESTAMP_FIELD)
+        if start < len(_TIMESTAMP_FIELD) or line[end:end + 1] != b'"':
+            return None
+    if end < start:
+        return None
+    return datetime.fromisoformat(line[start:end].decode("ascii"))
+
 
 class AuditStore:
     """Append-only storage for audit logs with HMAC signing.
@@ -20,12 +67,20 @@ class AuditStore:
     - Forensic export capability
     """
     
-    def __init__(self, log_path: str, crypto_core: CryptoCore):
+    def __init__(self, log_path: str, crypto_core: CryptoCore, fsync_interval: int = 256):
         """Initialize AuditStore.
         
+        Events are written through a buffered handle and are only durable
+        after a checkpoint, flush() or close(): a crash or kill can lose up
+        to fsync_interval - 1 signed events. Services that cannot afford
+        that should use a small interval (1 checkpoints every event) and
+        close() the store on shutdown.
+        
         Args:
             log_path: Path to audit log file
             crypto_core: CryptoCore instance for signing
+            fsync_interval: Events buffered between durability checkpoints
+                (flush + fsync); 0 disables the periodic checkpoint
         """
         self.log_path = Path(log_path)
         self.crypto_core = crypto_core
@@ -36,6 +91,12 @@ class AuditStore:
         # Create file if it doesn't exist
         if not self.log_path.exists():
             self.log_path.touch(mode=0o600)  # Owner read/write only
+        
+        # Keep one append handle open instead of opening the file per event
+        self.fsync_interval = fsync_interval
+        self._pending = 0
+        self._lock = threading.Lock()
+        self._fh = open(self.log_path, "ab", buffering=_WRITE_BUFFER_SIZE)
     
     def log_event(self, event: AuditEvent) -> None:
         """Append signed event to log.
@@ -52,9 +113,58 @@ class AuditStore:
         # Update event with signature
         event.signature = signature
         
-        # Append to log file (JSON Lines format)
-        with open(self.log_path, "a") as f:
-            f.write(event.to_json() + "\n")
+        # Append to log file (JSON Lines format). The signed bytes already
+        # hold every other field, so splice the signature in rather than
+        # serializing the event a second time; the pieces are copied straight
+        # into the write buffer instead of being joined into a new line first
+        parts = (
+            memoryview(signable_data)[:-1],
+            _SIGNATURE_FIELD,
+            signature.encode("ascii"),
+            b'"}\n'
+        )
+        with self._lock:
+            if self._fh.closed:
+                # Logging after close() (e.g. a restarted service) reopens the log
+                self._fh = open(self.log_path, "ab", buffering=_WRITE_BUFFER_SIZE)
+            self._fh.writelines(parts)
+            self._pending += 1
+            if self.fsync_interval and self._pending >= self.fsync_interval:
+                self._checkpoint()
+    
+    def flush(self) -> None:
+        """Write buffered events to disk and fsync the log."""
+        with self._lock:
+            self._checkpoint()
+    
+    def _checkpoint(self) -> None:
+        """Flush and fsync the append handle; caller holds the lock."""
+        if self._fh.closed:
+            return
+        self._fh.flush()
+        os.fsync(self._fh.fileno())
+        self._pending = 0
+    
+    def _flush_for_read(self) -> None:
+        """Push buffered events to the OS so readers of the file see them."""
+        with self._lock:
+            if not self._fh.closed:
+                self._fh.flush()
+    
+    def close(self) -> None:
+        """Flush pending events and close the log file."""
+        with self._lock:
+            if not self._fh.closed:
+                self._checkpoint()
+                self._fh.close()
+    
+    def __enter__(self) -> "AuditStore":
+        """Context manager entry."""
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Context manager exit."""
+        self.close()
     
     def verify_log_integrity(self) -> bool:
         """Verify all log entries have valid signatures.
@@ -62,30 +172,34 @@ class AuditStore:
         Returns:
             True if all signatures are valid, False otherwise
         """
+        self._flush_for_read()
         if not self.log_path.exists():
             return True  # Empty log is valid
         
-        with open(self.log_path, "r") as f:
+        # Line being verified; verify_batch stops pulling entries at the
+        # first bad signature, so this is the line to report
+        current_line = [0]
+        
+        def entries(f):
             for line_num, line in enumerate(f, 1):
                 line = line.strip()
                 if not line:
                     continue
                 
-                try:
-                    # Parse event
-                    event = AuditEvent.from_json(line)
-                    
-                    # Get signable data
-                    signable_data = event.get_signable_data()
-                    
-                    # Verify signature
-                    if not self.crypto_core.verify_signature(signable_data, event.signature):
-                        print(f"Invalid signature at line {line_num}")
-                        return False
-                        
-                except Exception as e:
-                    print(f"Error verifying line {line_num}: {e}")
+                current_line[0] = line_num
+                event = AuditEvent.from_json(line)
+                yield event.get_signable_data(), event.signature
+        
+        # Stream raw lines through a large buffer; json accepts bytes directly
+        with open(self.log_path, "rb", buffering=_READ_BUFFER_SIZE) as f:
+            try:
+                if not self.crypto_core.verify_batch(entries(f)):
+                    print(f"Invalid signature at line {current_line[0]}")
                     return False
+                    
+            except Exception as e:
+                print(f"Error verifying line {current_line[0]}: {e}")
+                return False
         
         return True
     
@@ -105,16 +219,29 @@ class AuditStore:
         """
         events = []
         
+        self._flush_for_read()
         if not self.log_path.exists():
             return events
         
-        with open(self.log_path, "r") as f:
+        filtered = start_time is not None or end_time is not None
+        
+        with open(self.log_path, "rb", buffering=_READ_BUFFER_SIZE) as f:
             for line in f:
                 line = line.strip()
                 if not line:
                     continue
                 
                 try:
+                    # Skip out-of-range entries on the timestamp alone, so
+                    # only the events returned pay for a full parse
+                    if filtered:
+                        timestamp = _peek_timestamp(line)
+                        if timestamp is not None and (
+                            (start_time and timestamp < start_time)
+                            or (end_time and timestamp > end_time)
+                        ):
+                            continue
+                    
                     event = AuditEvent.from_json(line)
                     
                     # Filter by time range
@@ -137,14 +264,23 @@ class AuditStore:
         Returns:
             Number of log entries
         """
+        self._flush_for_read()
         if not self.log_path.exists():
             return 0
         
+        # log_event writes one entry per line. Blank lines are skipped like
+        # export_logs does: with inline whitespace dropped they split out as
+        # empty, so each large block is counted in C rather than per line
         count = 0
-        with open(self.log_path, "r") as f:
-            for line in f:
-                if line.strip():
-                    count += 1
+        tail = b""
+        with open(self.log_path, "rb") as f:
+            for block in iter(lambda: f.read(_READ_BLOCK_SIZE), b""):
+                lines = (tail + block.translate(None, _INLINE_WHITESPACE)).split(b"\n")
+                tail = lines.pop()  # Partial line continued in the next block
+                count += len(lines) - lines.count(b"")
+        
+        if tail:
+            count += 1  # Final entry without a trailing newline
         
         return count
     
@@ -157,15 +293,43 @@ class AuditStore:
         Returns:
             List of latest AuditEvent instances
         """
-        if not self.log_path.exists():
+        self._flush_for_read()
+        if not self.log_path.exists() or count <= 0:
             return []
         
-        # Read all lines
-        with open(self.log_path, "r") as f:
-            lines = [line.strip() for line in f if line.strip()]
+        # Read backwards from the end until count complete lines are in
+        # hand, so the cost follows count rather than the log size. Only
+        # each new chunk's newlines are counted; the chunks are joined and
+        # split once there are enough of them
+        with open(self.log_path, "rb") as f:
+            pos = f.seek(0, os.SEEK_END)
+            chunks = []
+            newlines = 0
+            needed = count + 1  # The first line in the tail may start mid-entry
+            lines = []
+            while pos > 0:
+                step = min(_TAIL_CHUNK_SIZE, pos)
+                pos -= step
+                f.seek(pos)
+                chunk = f.read(step)
+                chunks.append(chunk)
+                newlines += chunk.count(b"\n")
+                if newlines < needed and pos > 0:
+                    continue
+                
+                lines = b"".join(reversed(chunks)).split(b"\n")
+                if pos > 0:
+                    lines = lines[1:]  # May start mid-entry
+                lines = [line.strip() for line in lines if line.strip()]
+                if len(lines) >= count:
+                    break
+                
+                # Blank lines took up part of the budget; read on until the
+                # shortfall can be covered before splitting again
+                needed = newlines + count - len(lines)
         
         # Get last N lines
-        latest_lines = lines[-count:] if len(lines) > count else lines
+        latest_lines = lines[-count:]
         
         # Parse events
         events = []
@@ -2,14 +2,64 @@
 
 import sqlite3
 import json
+import queue
+import threading
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional, List
+from typing import Iterable, Iterator, Optional, List, Tuple
 from datetime import datetime
 
 from pic.models.baseline import BaselineProfile
 from pic.models.detector import Detector
 
 
+_INSERT_BASELINE = """
+    INSERT OR REPLACE INTO baselines (
+        function_name, module_name, version, created_at, updated_at,
+        sample_count, mean_duration_ms, std_duration_ms,
+        p50_duration_ms, p95_duration_ms, p99_duration_ms, profile_json
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_INSERT_DETECTOR = """
+    INSERT OR REPLACE INTO detectors (
+        id, function_name, threshold, signature_hash,
+        created_at, expires_at, is_active
+    ) VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+_GET_BASELINE = """
+    SELECT * FROM baselines
+    WHERE function_name = ? AND module_name = ?
+    ORDER BY version DESC
+    LIMIT 1
+"""
+
+_GET_ACTIVE_DETECTORS = """
+    SELECT * FROM detectors
+    WHERE function_name = ? AND is_active = 1
+"""
+
+_EXPIRE_DETECTORS = """
+    UPDATE detectors
+    SET is_active = 0
+    WHERE expires_at IS NOT NULL AND expires_at <= ? AND is_active = 1
+"""
+
+# sqlite3 keeps compiled statements in a per-connection LRU keyed by SQL
+# text; size it well above the number of distinct statements used here
+_CACHED_STATEMENTS = 256
+
+# Milliseconds to wait on a locked database before raising SQLITE_BUSY
+_BUSY_TIMEOUT_MS = 5000
+
+# WAL pages written before SQLite checkpoints back into the database file
+_WAL_AUTOCHECKPOINT_PAGES = 1000
+
+# Path SQLite treats as a private, connection-local in-memory database
+_MEMORY_DB = ":memory:"
+
+
 class StateStore:
     """Persistent storage for baseline profiles and detectors using SQLite.
     
@@ -17,32 +67,124 @@ class StateStore:
     - WAL (Write-Ahead Logging) mode for better concurrency
     - Baseline profile versioning
     - Detector TTL management
-    - Atomic transactions
+    - Atomic transactions, with batched writes committed once
     """
     
-    def __init__(self, db_path: str):
+    def __init__(self, db_path: str, cache_mb: int = 64, mmap_mb: int = 256):
         """Initialize StateStore with database path.
         
         Args:
             db_path: Path to SQLite database file
+            cache_mb: SQLite page cache size in MiB
+            mmap_mb: Maximum size of the memory-mapped database region in MiB
+                (0 disables memory-mapped I/O)
         """
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         
+        # Other connections cannot open an in-memory database, so it is
+        # read through the writer instead of pooled readers
+        self._pooled_reads = str(db_path) != _MEMORY_DB
+        self.cache_mb = cache_mb
+        self.mmap_mb = mmap_mb
+        
         self.conn: Optional[sqlite3.Connection] = None
+        
+        # The writer connection is shared by all threads: one transaction at
+        # a time holds it, and only the owning thread sees itself as inside
+        self._write_lock = threading.RLock()
+        self._tx_state = threading.local()
+        
+        # Idle read-only connections; one is opened per concurrent reader
+        self._readers: "queue.SimpleQueue[sqlite3.Connection]" = queue.SimpleQueue()
         self._connect()
         self._init_schema()
     
     def _connect(self) -> None:
         """Establish database connection with WAL mode."""
-        self.conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self.conn = sqlite3.connect(
+            str(self.db_path),
+            check_same_thread=False,
+            cached_statements=_CACHED_STATEMENTS
+        )
         self.conn.row_factory = sqlite3.Row
         
         # Enable WAL mode for better concurrency
         self.conn.execute("PRAGMA journal_mode=WAL")
         self.conn.execute("PRAGMA synchronous=NORMAL")
+        self._apply_pragmas(self.conn)
+        self.conn.execute(f"PRAGMA wal_autocheckpoint={_WAL_AUTOCHECKPOINT_PAGES}")
         self.conn.commit()
     
+    def _apply_pragmas(self, conn: sqlite3.Connection) -> None:
+        """Apply the per-connection tuning shared by writer and readers.
+        
+        Args:
+            conn: Connection to configure
+        """
+        # Keep hot pages (get_baseline lookups) in memory and read the file
+        # through mmap rather than read() syscalls
+        conn.execute(f"PRAGMA cache_size=-{int(self.cache_mb) * 1024}")  # Negative = KiB
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute(f"PRAGMA mmap_size={int(self.mmap_mb) * 1024 * 1024}")
+        
+        # Wait for a competing writer instead of failing with SQLITE_BUSY
+        conn.execute(f"PRAGMA busy_timeout={_BUSY_TIMEOUT_MS}")
+    
+    def _open_reader(self) -> sqlite3.Connection:
+        """Open a read-only connection to the database.
+        
+        Returns:
+            New read-only connection
+        """
+        conn = sqlite3.connect(
+            f"{self.db_path.resolve().as_uri()}?mode=ro",
+            uri=True,
+            check_same_thread=False,
+            cached_statements=_CACHED_STATEMENTS
+        )
+        conn.row_factory = sqlite3.Row
+        self._apply_pragmas(conn)
+        return conn
+    
+    @contextmanager
+    def _reading(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a connection for a query.
+        
+        Queries run on pooled read-only connections, which WAL lets proceed
+        alongside writes instead of queueing behind commits on self.conn.
+        Inside transaction() the writer is used, so uncommitted writes are
+        visible to the caller. An in-memory database is always read through
+        the writer, between transactions.
+        
+        Yields:
+            Connection to query
+        """
+        if self.conn is None:
+            raise RuntimeError("Database connection not established")
+        
+        if self._in_tx:
+            yield self.conn
+            return
+        
+        if not self._pooled_reads:
+            with self._write_lock:
+                yield self.conn
+            return
+        
+        try:
+            conn = self._readers.get_nowait()
+        except queue.Empty:
+            conn = self._open_reader()
+        
+        try:
+            yield conn
+        finally:
+            self._readers.put(conn)
+            if self.conn is None:
+                # The store closed during the query; don't leave it pooled
+                self._close_readers()
+    
     def _init_schema(self) -> None:
         """Initialize database schema."""
         if self.conn is None:
@@ -103,17 +245,26 @@ class StateStore:
         if self.conn is None:
             raise RuntimeError("Database connection not established")
         
+        with self.transaction():
+            self.conn.execute(_INSERT_BASELINE, self._baseline_row(baseline))
+    
+    def store_baselines(self, baselines: Iterable[BaselineProfile]) -> None:
+        """Store or update several baseline profiles in one transaction.
+        
+        Args:
+            baselines: BaselineProfiles to store
+        """
+        with self.transaction():
+            self.conn.executemany(_INSERT_BASELINE, map(self._baseline_row, baselines))
+    
+    @staticmethod
+    def _baseline_row(baseline: BaselineProfile) -> Tuple:
+        """Build the baselines table parameters for a profile."""
         profile_json = json.dumps({
             "historical_distances": baseline.historical_distances
         })
         
-        self.conn.execute("""
-            INSERT OR REPLACE INTO baselines (
-                function_name, module_name, version, created_at, updated_at,
-                sample_count, mean_duration_ms, std_duration_ms,
-                p50_duration_ms, p95_duration_ms, p99_duration_ms, profile_json
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
+        return (
             baseline.function_name,
             baseline.module_name,
             baseline.version,
@@ -126,9 +277,7 @@ class StateStore:
             baseline.p95_duration_ms,
             baseline.p99_duration_ms,
             profile_json
-        ))
-        
-        self.conn.commit()
+        )
     
     def get_baseline(self, function_name: str, module_name: str) -> Optional[BaselineProfile]:
         """Retrieve latest baseline profile for a function.
@@ -140,17 +289,11 @@ class StateStore:
         Returns:
             BaselineProfile if found, None otherwise
         """
-        if self.conn is None:
-            raise RuntimeError("Database connection not established")
-        
-        cursor = self.conn.execute("""
-            SELECT * FROM baselines
-            WHERE function_name = ? AND module_name = ?
-            ORDER BY version DESC
-            LIMIT 1
-        """, (function_name, module_name))
+        with self._reading() as conn:
+            cursor = conn.execute(_GET_BASELINE, (function_name, module_name))
+            row = cursor.fetchone()
+            cursor.close()  # End the read so the pooled connection sees later commits
         
-        row = cursor.fetchone()
         if row is None:
             return None
         
@@ -180,14 +323,24 @@ class StateStore:
         if self.conn is None:
             raise RuntimeError("Database connection not established")
         
+        with self.transaction():
+            self.conn.execute(_INSERT_DETECTOR, self._detector_row(detector))
+    
+    def store_detectors(self, detectors: Iterable[Detector]) -> None:
+        """Store several detectors in one transaction.
+        
+        Args:
+            detectors: Detectors to store
+        """
+        with self.transaction():
+            self.conn.executemany(_INSERT_DETECTOR, map(self._detector_row, detectors))
+    
+    @staticmethod
+    def _detector_row(detector: Detector) -> Tuple:
+        """Build the detectors table parameters for a detector."""
         expires_at = detector.expires_at.isoformat() if detector.expires_at else None
         
-        self.conn.execute("""
-            INSERT OR REPLACE INTO detectors (
-                id, function_name, threshold, signature_hash,
-                created_at, expires_at, is_active
-            ) VALUES (?, ?, ?, ?, ?, ?, ?)
-        """, (
+        return (
             detector.id,
             detector.function_name,
             detector.threshold,
@@ -195,9 +348,7 @@ class StateStore:
             detector.created_at.isoformat(),
             expires_at,
             1 if detector.is_active else 0
-        ))
-        
-        self.conn.commit()
+        )
     
     def get_active_detectors(self, function_name: str) -> List[Detector]:
         """Get active detectors for a function.
@@ -208,16 +359,11 @@ class StateStore:
         Returns:
             List of active Detector instances
         """
-        if self.conn is None:
-            raise RuntimeError("Database connection not established")
-        
-        cursor = self.conn.execute("""
-            SELECT * FROM detectors
-            WHERE function_name = ? AND is_active = 1
-        """, (function_name,))
+        with self._reading() as conn:
+            rows = conn.execute(_GET_ACTIVE_DETECTORS, (function_name,)).fetchall()
         
         detectors = []
-        for row in cursor.fetchall():
+        for row in rows:
             expires_at = None
             if row["expires_at"]:
                 expires_at = datetime.fromisoformat(row["expires_at"])
@@ -246,20 +392,61 @@ class StateStore:
         
         now = datetime.now().isoformat()
         
-        cursor = self.conn.execute("""
-            UPDATE detectors
-            SET is_active = 0
-            WHERE expires_at IS NOT NULL AND expires_at <= ? AND is_active = 1
-        """, (now,))
+        with self.transaction():
+            cursor = self.conn.execute(_EXPIRE_DETECTORS, (now,))
         
-        self.conn.commit()
         return cursor.rowcount
     
+    @contextmanager
+    def transaction(self) -> Iterator["StateStore"]:
+        """Group writes into a single transaction.
+        
+        Writes made through the store inside the block are committed once
+        on exit (so SQLite syncs once rather than per row) and rolled back
+        if the block raises. Nested blocks join the outer transaction.
+        Writes from other threads wait until the block ends and are
+        committed separately, so a rollback never discards them.
+        
+        Yields:
+            This StateStore
+        """
+        if self.conn is None:
+            raise RuntimeError("Database connection not established")
+        
+        with self._write_lock:
+            if self._in_tx:
+                yield self
+                return
+            
+            self._tx_state.active = True
+            try:
+                with self.conn:
+                    yield self
+            finally:
+                self._tx_state.active = False
+    
+    @property
+    def _in_tx(self) -> bool:
+        """Whether the calling thread is inside transaction()."""
+        return getattr(self._tx_state, "active", False)
+    
+    def _close_readers(self) -> None:
+        """Close every idle read-only connection."""
+        while True:
+            try:
+                self._readers.get_nowait().close()
+            except queue.Empty:
+                break
+    
     def close(self) -> None:
-        """Close database connection."""
-        if self.conn:
-            self.conn.close()
-            self.conn = None
+        """Close database connections."""
+        # Clear self.conn before draining the pool, so a reader returned
+        # after the drain sees the store closed and closes itself
+        conn, self.conn = self.conn, None
+        self._close_readers()
+        
+        if conn:
+            conn.close()
     
     def __enter__(self) -> "StateStore":
         """Context manager entry."""
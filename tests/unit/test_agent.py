@@ -0,0 +1,91 @@
+"""Unit tests for CellAgent."""
+
+from pic.cellagent import CellAgent, clock_override
+from pic.cellagent import clock
+from pic.config import PICConfig
+from pic.models.decision import Decision
+
+
+def test_seed_baseline_buffers_observations_without_calling():
+    """Test that seeded observations are buffered for the wrapped function."""
+    config = PICConfig.load(config_path="/nonexistent/path.yaml")
+    agent = CellAgent(config=config)
+    calls = []
+    
+    @agent.monitor
+    def process(amount):
+        calls.append(amount)
+        return amount
+    
+    agent.seed_baseline(process, [5.0, 6.0, 7.0], 100)
+    
+    events = list(agent._buffer)
+    assert calls == []
+    assert [e.duration_ms for e in events] == [5.0, 6.0, 7.0]
+    assert {e.function_name for e in events} == {"process"}
+    assert len({e.event_id for e in events}) == 3
+    assert agent.get_stats()["total_events"] == 3
+
+
+def test_monitor_batch_matches_individual_calls():
+    """Test that a batch returns each call's result and buffers its events."""
+    config = PICConfig.load(config_path="/nonexistent/path.yaml")
+    agent = CellAgent(config=config)
+    agent.sampling_rate = 1.0
+    
+    @agent.monitor
+    def double(x):
+        return x * 2
+    
+    assert agent.monitor_batch(double, range(5)) == [0, 2, 4, 6, 8]
+    
+    events = list(agent._buffer)
+    assert len(events) == 5
+    assert {e.function_name for e in events} == {"double"}
+    assert agent.get_stats()["total_events"] == 5
+
+
+def test_monitor_batch_with_brain_decides_each_call():
+    """Test that a brain-connected batch monitors undecorated functions."""
+    config = PICConfig.load(config_path="/nonexistent/path.yaml")
+    agent = CellAgent(config=config)
+    agent.sampling_rate = 1.0
+    sent = []
+    
+    class Connector:
+        def send_event(self, event):
+            sent.append(event.function_name)
+            return Decision.allow()
+    
+    agent.set_brain_connector(Connector())
+    
+    def triple(x):
+        return x * 3
+    
+    assert agent.monitor_batch(triple, range(3)) == [0, 3, 6]
+    assert sent == ["triple"] * 3
+    assert len(agent._buffer) == 3
+
+
+def test_monitor_fast_commits_recorded_durations():
+    """Test that timed-only calls are buffered when committed."""
+    config = PICConfig.load(config_path="/nonexistent/path.yaml")
+    agent = CellAgent(config=config)
+    
+    @agent.monitor
+    def slow_operation(amount):
+        clock.sleep(0.002)
+        return amount
+    
+    timed = agent.monitor_fast(slow_operation, capacity=4)
+    
+    with clock_override():
+        assert [timed(i) for i in range(6)] == list(range(6))
+    
+    assert len(agent._buffer) == 0
+    assert agent.commit_fast(timed) == 4
+    
+    events = list(agent._buffer)
+    assert [e.duration_ms for e in events] == [2.0] * 4
+    assert {e.function_name for e in events} == {"slow_operation"}
+    assert agent.commit_fast(timed) == 0
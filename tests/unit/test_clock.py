@@ -0,0 +1,60 @@
+"""Unit tests for the CellAgent clock override."""
+
+import threading
+import time
+
+from pic.cellagent import CellAgent, clock_override
+from pic.cellagent import clock
+from pic.config import PICConfig
+
+
+def test_override_sleep_advances_without_blocking():
+    """Test that sleep() under an override only advances the fake clock."""
+    start = time.perf_counter()
+    
+    with clock_override(start=10.0) as fake:
+        clock.sleep(5.0)
+        fake.advance_ms(250)
+        assert clock.perf_counter() == 15.25
+    
+    assert time.perf_counter() - start < 1.0
+    assert clock.current_clock() is None
+
+
+def test_override_is_thread_local():
+    """Test that other threads keep using real time."""
+    seen = []
+    
+    with clock_override():
+        thread = threading.Thread(target=lambda: seen.append(clock.current_clock()))
+        thread.start()
+        thread.join()
+    
+    assert seen == [None]
+
+
+def test_monitor_records_simulated_duration():
+    """Test that monitored calls are timed with the overriding clock."""
+    config = PICConfig.load(config_path="/nonexistent/path.yaml")
+    agent = CellAgent(config=config)
+    agent.sampling_rate = 1.0
+    
+    @agent.monitor
+    def slow_operation():
+        clock.sleep(2.0)
+        return "done"
+    
+    with clock_override():
+        assert slow_operation() == "done"
+    
+    assert agent._buffer[-1].duration_ms == 2000.0
+
+
+def test_run_simulated_scopes_the_override():
+    """Test that run_simulated() overrides the clock only for the call."""
+    def sleep_and_read(seconds, offset=0.0):
+        clock.sleep(seconds)
+        return clock.perf_counter() + offset
+    
+    assert clock.run_simulated(sleep_and_read, 3.0, offset=0.5) == 3.5
+    assert clock.current_clock() is None
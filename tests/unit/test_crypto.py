@@ -66,6 +66,22 @@ def test_signature_verification():
         assert crypto.verify_signature(b"modified data", signature) is False
 
 
+def test_batch_verification():
+    """Test verifying many signatures at once."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        key_path = Path(tmpdir) / "test.key"
+        crypto = CryptoCore(str(key_path))
+        
+        pairs = [(data, crypto.hmac_sign(data)) for data in (b"a", b"b", b"c")]
+        
+        assert crypto.verify_batch(pairs) is True
+        assert crypto.verify_batch([]) is True
+        
+        # One bad signature fails the batch
+        pairs[1] = (b"b", pairs[0][1])
+        assert crypto.verify_batch(pairs) is False
+
+
 def test_sha256_hash():
     """Test SHA-256 hashing."""
     data = b"test data"
@@ -0,0 +1,40 @@
+"""Unit tests for the latency tester's EMA baseline helpers."""
+
+import math
+
+from pic.realworld.testers.latency import _ema_baseline, _ema_recovered, _ema_update
+
+
+def run_stream(recovery_ms: float, recovery_samples: int = 10):
+    """Feed five 2000ms anomalies, then recovery latencies, into a 50ms baseline.
+    
+    Returns:
+        Tuple of (pre-anomaly baseline, peak mean, final mean, final variance)
+    """
+    baseline = _ema_baseline([50.0, 50.2, 49.8, 50.1, 49.9] * 6)
+    mu, s = baseline
+    for _ in range(5):
+        mu, s = _ema_update(mu, s, 2000.0)
+    peak_mu = mu
+    for _ in range(recovery_samples):
+        mu, s = _ema_update(mu, s, recovery_ms)
+    return baseline, peak_mu, mu, s
+
+
+def test_recovered_stream_passes():
+    """Test that normal latencies after the anomalies count as recovered."""
+    baseline, peak_mu, mu, _ = run_stream(50.0)
+    
+    assert _ema_recovered(baseline, peak_mu, mu, 10)
+
+
+def test_unrecovered_stream_fails():
+    """Test that a stream still running slow after the anomalies fails."""
+    baseline, peak_mu, mu, s = run_stream(500.0)
+    
+    # The inflated post-anomaly sigma alone would accept this mean
+    assert abs(mu - baseline[0]) <= 3 * math.sqrt(s)
+    assert not _ema_recovered(baseline, peak_mu, mu, 10)
+    
+    baseline, peak_mu, mu, _ = run_stream(2000.0)
+    assert not _ema_recovered(baseline, peak_mu, mu, 10)
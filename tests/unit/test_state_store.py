@@ -0,0 +1,132 @@
+"""Unit tests for StateStore."""
+
+import sqlite3
+import tempfile
+import threading
+import pytest
+from datetime import datetime, timedelta
+
+from pic.storage.state_store import StateStore
+from pic.models.baseline import BaselineProfile
+from pic.models.detector import Detector
+
+
+def make_baseline(function_name: str) -> BaselineProfile:
+    """Create a baseline profile for a test function."""
+    now = datetime.now()
+    return BaselineProfile(
+        function_name=function_name,
+        module_name="test_module",
+        version=1,
+        created_at=now,
+        updated_at=now,
+        sample_count=50,
+        mean_duration_ms=5.0,
+        std_duration_ms=0.5,
+        p50_duration_ms=5.0,
+        p95_duration_ms=6.0,
+        p99_duration_ms=7.0,
+        historical_distances=[]
+    )
+
+
+def make_detector(index: int) -> Detector:
+    """Create an active detector for a shared test function."""
+    return Detector(
+        id=f"det-{index}",
+        function_name="test_function",
+        threshold=0.5,
+        signature_hash=f"{index:064x}",
+        created_at=datetime.now(),
+        expires_at=datetime.now() + timedelta(days=90),
+        is_active=True
+    )
+
+
+def test_batch_stores():
+    """Test storing baselines and detectors in batches."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        with StateStore(f"{tmpdir}/state.db") as store:
+            store.store_baselines(make_baseline(f"func_{i}") for i in range(5))
+            store.store_detectors(make_detector(i) for i in range(3))
+            
+            assert store.get_baseline("func_3", "test_module").mean_duration_ms == 5.0
+            assert len(store.get_active_detectors("test_function")) == 3
+
+
+def test_transaction_rolls_back_on_error():
+    """Test that writes in a failed transaction are discarded."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        with StateStore(f"{tmpdir}/state.db") as store:
+            with pytest.raises(ValueError):
+                with store.transaction():
+                    store.store_baseline(make_baseline("func"))
+                    store.store_detector(make_detector(0))
+                    raise ValueError("abort")
+            
+            assert store.get_baseline("func", "test_module") is None
+            assert store.get_active_detectors("test_function") == []
+            
+            with store.transaction():
+                store.store_baseline(make_baseline("func"))
+            
+            assert store.get_baseline("func", "test_module") is not None
+
+
+def test_rollback_keeps_other_threads_writes():
+    """Test that a write from another thread survives a transaction rollback."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        with StateStore(f"{tmpdir}/state.db") as store:
+            entered = threading.Event()
+            writer = threading.Thread(
+                target=lambda: (entered.wait(), store.store_detector(make_detector(1)))
+            )
+            writer.start()
+            
+            with pytest.raises(ValueError):
+                with store.transaction():
+                    store.store_detector(make_detector(0))
+                    entered.set()
+                    writer.join(timeout=0.2)  # Blocked until the transaction ends
+                    raise ValueError("abort")
+            
+            writer.join()
+            
+            detectors = store.get_active_detectors("test_function")
+            assert [d.id for d in detectors] == ["det-1"]
+
+
+def test_reads_see_later_commits():
+    """Test that pooled read connections observe each committed write."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        with StateStore(f"{tmpdir}/state.db") as store:
+            assert store.get_baseline("func", "test_module") is None
+            
+            baseline = make_baseline("func")
+            store.store_baseline(baseline)
+            assert store.get_baseline("func", "test_module").mean_duration_ms == 5.0
+            
+            baseline.mean_duration_ms = 9.0
+            store.store_baseline(baseline)
+            assert store.get_baseline("func", "test_module").mean_duration_ms == 9.0
+
+
+def test_in_memory_store():
+    """Test that an in-memory store reads through its writer connection."""
+    with StateStore(":memory:") as store:
+        store.store_baseline(make_baseline("func"))
+        store.store_detector(make_detector(0))
+        
+        assert store.get_baseline("func", "test_module").mean_duration_ms == 5.0
+        assert len(store.get_active_detectors("test_function")) == 1
+
+
+def test_reader_returned_after_close_is_closed():
+    """Test that a read connection in use during close() is not pooled again."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        store = StateStore(f"{tmpdir}/state.db")
+        with store._reading() as conn:
+            store.close()
+        
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")